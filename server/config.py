@@ -1,8 +1,291 @@
 import json
 import os
-import glob
-from typing import Dict, Any, Optional, Union, List, Tuple
+import copy
+import functools
+import hashlib
+import itertools
+import pickle
+import sys
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Union, List, Tuple, Mapping, Iterator, Iterable, Callable, NamedTuple
 from pathlib import Path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Device driver profiles live next to this file; resolved once at import
+_DRIVERS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'drivers')
+_DRIVERS_DIR_P = Path(_DRIVERS_DIR)
+_PROGRESSIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chord_progressions.json')
+
+# Bump if the compiled cache format changes; edits to this module (DEFAULTS and the
+# merge/compile code) already invalidate cached configs through its stat in the key
+_COMPILED_CACHE_VERSION = 1
+_COMPILED_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'strumboli'
+)
+
+# Parsed JSON files keyed by (path, mtime_ns, size) so repeated loads skip the parse
+_FILE_CACHE: Dict[Tuple[str, int, int], Any] = {}
+
+# (driver_name, path) entries in the drivers directory keyed by (directory, mtime_ns)
+_DRIVER_LIST_CACHE: Dict[Tuple[str, int], List[Tuple[str, str]]] = {}
+
+
+# Driver profile fields copied into drawingTablet alongside deviceInfo
+_DRIVER_FIELDS = ('byteCodeMappings', 'reportId')
+
+# Driver profile metadata kept under drawingTablet._driverInfo
+_DRIVER_META = ('name', 'manufacturer', 'model')
+
+# Tablet button keys filled by a chord progression preset
+_PROGRESSION_BUTTON_KEYS = ("1", "2", "3", "4", "5", "6", "7", "8")
+
+# Expanded tabletButtons dicts keyed by chord progression name
+_PROGRESSION_CACHE: Dict[str, Dict[str, List[str]]] = {}
+
+
+# Config and driver key vocabulary; parsed copies of these keys are interned
+# so every dict shares one string object per key and lookups hit the
+# identity fast path
+_KNOWN_KEYS = frozenset({
+    'startupConfiguration', 'drawingTablet', 'deviceInfo', 'byteCodeMappings',
+    'reportId', 'buttonInterfaceReportId', 'interfaces', 'interface',
+    'product', 'productId', 'vendorId', 'usage', 'name', 'manufacturer', 'model',
+    'type', 'byteIndex', 'byteIndices', 'min', 'max', 'positiveMin', 'positiveMax',
+    'negativeMin', 'negativeMax', 'buttonCount', 'values', 'code', 'state',
+    'status', 'x', 'y', 'pressure', 'tiltX', 'tiltY', 'tabletButtons',
+    'stylusButtons', 'keyMappings', 'useSocketServer', 'socketServerPort',
+    'useWebServer', 'webServerPort', 'midiInputId', 'midiOutputId',
+    'midiOutputBackend', 'jackClientName', 'jackAutoConnect',
+    'initialNotes', 'upperNoteSpread', 'lowerNoteSpread', 'noteDuration',
+    'pitchBend', 'noteVelocity', 'control', 'default', 'multiplier', 'curve',
+    'spread', 'active', 'strumming', 'noteRepeater', 'transpose', 'strumRelease',
+    'primaryButtonAction', 'secondaryButtonAction', 'midiChannel', 'midiNote',
+    'maxDuration', 'pressureThreshold', 'pluckVelocityScale',
+})
+
+
+def _intern_pairs(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """json object_pairs_hook that interns known config keys."""
+    return {sys.intern(k) if k in _KNOWN_KEYS else k: v for k, v in pairs}
+
+
+def _intern_keys(data: Any) -> Any:
+    """Rebuild parsed JSON so known config keys are interned (for orjson output)."""
+    if type(data) is dict:
+        return {sys.intern(k) if k in _KNOWN_KEYS else k: _intern_keys(v) for k, v in data.items()}
+    if type(data) is list:
+        return [_intern_keys(v) for v in data]
+    return data
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed. Known keys are interned."""
+    if orjson is not None:
+        return _intern_keys(orjson.loads(data))
+    return json.loads(data, object_pairs_hook=_intern_pairs)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to 2-space indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _cached_json_load(path: Union[str, Path], copy_result: bool = True) -> Any:
+    """
+    Load a JSON file, reusing the parsed result while the file is unchanged.
+    
+    The file is stat()ed once per call; it is only opened and parsed when its
+    mtime or size differs from the cached entry. Callers receive a deep copy
+    so mutations never leak back into the cache.
+    
+    Args:
+        path: Path to the JSON file
+        copy_result: Set to False only when the caller copies the data itself
+                     before mutating it
+        
+    Returns:
+        Parsed JSON data
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    
+    data = _FILE_CACHE.get(key)
+    if data is None:
+        with open(path, 'rb') as f:
+            data = _json_loads(f.read())
+        _FILE_CACHE[key] = data
+    
+    return copy.deepcopy(data) if copy_result else data
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation config key into its parts (cached)."""
+    return tuple(key.split('.'))
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mapping proxies and lists to tuples."""
+    if type(value) is dict:
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if type(value) is list:
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Build a fresh mutable copy of a value produced by _freeze()."""
+    if type(value) is MappingProxyType or type(value) is dict:
+        return {k: _thaw(v) for k, v in value.items()}
+    if type(value) is tuple or type(value) is list:
+        return [_thaw(v) for v in value]
+    return value
+
+
+class MappingType(IntEnum):
+    """byteCodeMappings 'type' strings, decoded once when mappings are compiled."""
+    UNKNOWN = -1
+    CODE = 0
+    RANGE = 1
+    BIPOLAR_RANGE = 2
+    MULTI_BYTE_RANGE = 3
+    BIT_FLAGS = 4
+    KEYBOARD_EVENTS = 5
+
+
+_MAPPING_TYPE_CODES = {
+    'code': MappingType.CODE,
+    'range': MappingType.RANGE,
+    'bipolar-range': MappingType.BIPOLAR_RANGE,
+    'multi-byte-range': MappingType.MULTI_BYTE_RANGE,
+    'bit-flags': MappingType.BIT_FLAGS,
+    'keyboard-events': MappingType.KEYBOARD_EVENTS,
+}
+
+
+class CompiledMapping(NamedTuple):
+    """A byteCodeMappings entry resolved into a fixed layout with defaults applied."""
+    key: str
+    type: MappingType
+    byte_index: int
+    byte_indices: Tuple[int, ...]
+    min: int
+    max: int
+    positive_min: int
+    positive_max: int
+    negative_min: int
+    negative_max: int
+    button_count: int
+    values: Any
+    values_lut: Optional[Tuple[Any, ...]]
+
+
+def _build_values_lut(values: Any) -> Optional[Tuple[Any, ...]]:
+    """
+    Build a 256-entry lookup table for a code mapping's values.
+    
+    Dict values keyed by stringified byte values ("192") are indexed by the
+    int byte value, with {} for unmapped bytes. Legacy list values map by
+    position, with 0 for bytes beyond the list. Mirrors datahelpers.parse_code.
+    """
+    if isinstance(values, dict):
+        lut = [{}] * 256
+        for code, value in values.items():
+            try:
+                index = int(code)
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < 256:
+                lut[index] = value
+        return tuple(lut)
+    if isinstance(values, list):
+        return tuple(values[:256]) + (0,) * (256 - min(len(values), 256))
+    return None
+
+
+def _compile_mapping(key: str, mapping: Dict[str, Any]) -> CompiledMapping:
+    """Resolve a single byte code mapping into a CompiledMapping."""
+    mapping_type = _MAPPING_TYPE_CODES.get(mapping.get('type'), MappingType.UNKNOWN)
+    values = mapping.get('values', {})
+    return CompiledMapping(
+        key=key,
+        type=mapping_type,
+        byte_index=mapping.get('byteIndex', 0),
+        byte_indices=tuple(mapping.get('byteIndices', ())),
+        min=mapping.get('min', 0),
+        max=mapping.get('max', 0),
+        positive_min=mapping.get('positiveMin', 0),
+        positive_max=mapping.get('positiveMax', 0),
+        negative_min=mapping.get('negativeMin', 0),
+        negative_max=mapping.get('negativeMax', 0),
+        button_count=mapping.get('buttonCount', 8),
+        values=values,
+        values_lut=_build_values_lut(values) if mapping_type is MappingType.CODE else None,
+    )
+
+
+def _section(config: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return config[key] if it is a dict, else an empty dict (sections can be overwritten with any value)"""
+    value = config.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+class _ConfigView:
+    """
+    Flat snapshot of the values exposed by Config's convenience properties.
+    
+    Resolved once per change so property reads are a single attribute load
+    instead of a chain of dict lookups. Dict-valued entries are exposed as
+    read-only MappingProxyType views of the live config, so callers can hold
+    on to them without copying and cannot corrupt the config through them.
+    """
+    
+    __slots__ = (
+        'device', 'use_socket_server', 'socket_server_port', 'use_web_server',
+        'web_server_port', 'midi_input_id', 'midi_output_id', 'midi_output_backend',
+        'jack_client_name', 'jack_auto_connect', 'midi_strum_channel', 'initial_notes',
+        'upper_note_spread', 'lower_note_spread', 'note_duration', 'pitch_bend',
+        'note_velocity', 'mappings', 'report_id', 'mappings_source'
+    )
+    
+    def __init__(self, config: Dict[str, Any]):
+        startup = _section(config, 'startupConfiguration')
+        strumming = _section(config, 'strumming')
+        device = _section(startup, 'drawingTablet')
+        
+        self.device = MappingProxyType(device)
+        self.use_socket_server = startup.get('useSocketServer', True)
+        self.socket_server_port = startup.get('socketServerPort', 8080)
+        self.use_web_server = startup.get('useWebServer', False)
+        self.web_server_port = startup.get('webServerPort', 80)
+        self.midi_input_id = startup.get('midiInputId')
+        self.midi_output_id = startup.get('midiOutputId')
+        self.midi_output_backend = startup.get('midiOutputBackend', 'rtmidi')
+        self.jack_client_name = startup.get('jackClientName', 'midi_strummer')
+        self.jack_auto_connect = startup.get('jackAutoConnect', 'chain0')
+        self.midi_strum_channel = strumming.get('midiChannel')
+        self.initial_notes = strumming.get('initialNotes', ["C4", "E4", "G4"])
+        self.upper_note_spread = strumming.get('upperNoteSpread', 3)
+        self.lower_note_spread = strumming.get('lowerNoteSpread', 3)
+        self.note_duration = MappingProxyType(_section(config, 'noteDuration'))
+        self.pitch_bend = MappingProxyType(_section(config, 'pitchBend'))
+        self.note_velocity = MappingProxyType(_section(config, 'noteVelocity'))
+        self.mappings_source = _section(device, 'byteCodeMappings')
+        self.mappings = MappingProxyType(self.mappings_source)
+        self.report_id = device.get('reportId', 2)
 
 
 class Config:
@@ -118,6 +401,10 @@ class Config:
         }
     }
     
+    # Read-only snapshot of DEFAULTS shared by every instance; each Config
+    # only copies the parts it actually uses
+    _DEFAULTS_FROZEN = _freeze(DEFAULTS)
+    
     def __init__(self, config_dict: Optional[Dict[str, Any]] = None):
         """
         Initialize configuration with optional overrides.
@@ -125,13 +412,23 @@ class Config:
         Args:
             config_dict: Optional dictionary to override defaults
         """
+        if not config_dict:
+            # Nothing to merge - just take a private copy of the defaults
+            self._config = _thaw(self._DEFAULTS_FROZEN)
+            self._refresh_view()
+            return
+        
+        # Take one private copy up front; the processing steps below mutate it
+        # in place and the merged result must not alias the caller's dict
+        config_dict = copy.deepcopy(config_dict)
+        
         # Process device driver profiles before merging
-        processed_config = self._process_device_drivers(config_dict or {})
+        processed_config = self._process_device_drivers(config_dict)
         # Expand chord progression presets for tabletButtons
         processed_config = self._expand_chord_progressions(processed_config)
         
         # Merge with defaults, but if a driver profile was loaded, don't merge drawingTablet
-        merged = self._deep_merge(self.DEFAULTS.copy(), processed_config)
+        merged = self._deep_merge(self._DEFAULTS_FROZEN, processed_config)
         
         # If we loaded a driver profile, ensure it completely replaces the default
         if (processed_config.get('startupConfiguration', {}).get('drawingTablet') and 
@@ -140,6 +437,58 @@ class Config:
             merged['startupConfiguration']['drawingTablet'] = processed_config['startupConfiguration']['drawingTablet']
         
         self._config = merged
+        self._refresh_view()
+    
+    def _refresh_view(self) -> None:
+        """Rebuild the flat property view, recompiling mappings if they were replaced."""
+        self._view = _ConfigView(self._config)
+        self._revision = getattr(self, '_revision', 0) + 1
+        if self._view.mappings_source is not getattr(self, '_compiled_source', None):
+            self._compile_mappings()
+    
+    def _compile_mappings(self) -> None:
+        """
+        Compile byteCodeMappings into a tuple of CompiledMapping rows.
+        
+        The HID decode path can then iterate fixed-layout tuples with
+        MappingType codes instead of walking nested dicts per packet.
+        """
+        mappings = self._view.mappings_source
+        self._mapping_arr = tuple(
+            _compile_mapping(key, mapping)
+            for key, mapping in mappings.items()
+            if isinstance(mapping, dict)
+        )
+        self._mapping_index = {row.key: i for i, row in enumerate(self._mapping_arr)}
+        
+        # The first code mapping carries the device status byte
+        self._status_mapping = next(
+            (row for row in self._mapping_arr
+             if row.type is MappingType.CODE and row.values_lut is not None), None
+        )
+        self._status_lut = self._status_mapping.values_lut if self._status_mapping else None
+        self._compiled_source = mappings
+    
+    @classmethod
+    def _from_validated_dict(cls, config: Dict[str, Any]) -> 'Config':
+        """
+        Wrap an already fully resolved configuration without reprocessing it.
+        
+        Skips driver loading, chord progression expansion and the merge with
+        defaults, so it must only be given dicts produced by a previous
+        Config (e.g. its _config or a compiled cache entry). The dict is
+        adopted, not copied.
+        
+        Args:
+            config: Fully merged configuration dictionary
+            
+        Returns:
+            Config instance wrapping the dictionary
+        """
+        self = cls.__new__(cls)
+        self._config = config
+        self._refresh_view()
+        return self
     
     @classmethod
     def from_file(cls, file_path: str) -> 'Config':
@@ -158,8 +507,8 @@ class Config:
             return cls()
         
         try:
-            with open(path, 'r') as f:
-                config_dict = json.load(f)
+            # Config.__init__ takes its own copy, so skip the cache copy here
+            config_dict = _cached_json_load(path, copy_result=False)
             print(f"Loaded configuration from '{file_path}'")
             return cls(config_dict)
         except json.JSONDecodeError as e:
@@ -171,6 +520,91 @@ class Config:
             print("Using default configuration.")
             return cls()
     
+    @classmethod
+    def from_file_cached(cls, file_path: str) -> 'Config':
+        """
+        Load configuration from a JSON file, reusing a previously compiled result.
+        
+        The fully resolved configuration is pickled to the user cache directory
+        along with a key built from the settings file, driver profiles, chord
+        progressions and cache version. While none of those change, later
+        startups unpickle it instead of parsing and merging. Configurations
+        that auto-detect their tablet are never cached, since the result
+        depends on what is plugged in.
+        
+        Args:
+            file_path: Path to JSON configuration file
+            
+        Returns:
+            Config instance with loaded settings
+        """
+        abs_path = os.path.abspath(file_path)
+        try:
+            key = cls._compiled_cache_key(abs_path)
+        except OSError:
+            # Missing settings file etc. - let from_file report it
+            return cls.from_file(file_path)
+        
+        cache_file = os.path.join(
+            _COMPILED_CACHE_DIR,
+            hashlib.blake2b(abs_path.encode('utf-8'), digest_size=16).hexdigest() + '.pkl'
+        )
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('key') == key:
+                print(f"Loaded configuration from '{file_path}' (compiled cache)")
+                return cls._from_validated_dict(cached['config'])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[Config] Ignoring unreadable compiled config cache: {e}")
+        
+        config = cls.from_file(file_path)
+        
+        try:
+            raw = _cached_json_load(abs_path, copy_result=False)
+        except Exception:
+            # from_file fell back to defaults - nothing worth caching
+            return config
+        
+        tablet = raw.get('startupConfiguration', {}).get('drawingTablet') if isinstance(raw, dict) else None
+        if tablet == 'auto-detect':
+            return config
+        
+        try:
+            os.makedirs(_COMPILED_CACHE_DIR, exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump({'key': key, 'config': config._config}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"[Config] Could not write compiled config cache: {e}")
+        
+        return config
+    
+    @staticmethod
+    def _compiled_cache_key(abs_path: str) -> str:
+        """
+        Build the compiled-config cache key from everything the result depends on.
+        
+        Raises:
+            OSError: If the settings file cannot be stat()ed
+        """
+        st = os.stat(abs_path)
+        parts = [abs_path, str(st.st_mtime_ns), str(st.st_size), str(_COMPILED_CACHE_VERSION)]
+        
+        # This module's own stat covers DEFAULTS and the merge/compile code
+        dependencies = [os.path.abspath(__file__), _PROGRESSIONS_FILE]
+        dependencies += [p for _, p in Config._list_driver_files()]
+        for path in dependencies:
+            try:
+                dep = os.stat(path)
+                parts.append(f"{path}:{dep.st_mtime_ns}:{dep.st_size}")
+            except OSError:
+                parts.append(f"{path}:missing")
+        
+        return hashlib.blake2b('|'.join(parts).encode('utf-8')).hexdigest()
+    
     @staticmethod
     def _load_device_driver(driver_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -182,16 +616,12 @@ class Config:
         Returns:
             Driver configuration dictionary, or None if not found
         """
-        # Get the directory where this config.py file is located
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        drivers_dir = os.path.join(current_dir, 'drivers')
-        driver_path = os.path.join(drivers_dir, f'{driver_name}.json')
+        driver_path = _DRIVERS_DIR_P / f'{driver_name}.json'
         
         try:
-            with open(driver_path, 'r') as f:
-                driver_config = json.load(f)
-                print(f"[Config] Loaded device driver: {driver_config.get('name', driver_name)}")
-                return driver_config
+            driver_config = _cached_json_load(driver_path)
+            print(f"[Config] Loaded device driver: {driver_config.get('name', driver_name)}")
+            return driver_config
         except FileNotFoundError:
             print(f"[Config] Warning: Device driver '{driver_name}' not found at {driver_path}")
             return None
@@ -202,6 +632,33 @@ class Config:
             print(f"[Config] Error loading device driver '{driver_name}': {e}")
             return None
     
+    @staticmethod
+    def _list_driver_files() -> List[Tuple[str, str]]:
+        """
+        List the device driver profile files without parsing them.
+        
+        Returns:
+            List of tuples: (driver_name, driver_path), sorted by name
+        """
+        try:
+            dir_key = (_DRIVERS_DIR, os.stat(_DRIVERS_DIR).st_mtime_ns)
+        except OSError:
+            return []
+        
+        # Only rescan the folder when its contents (file set) have changed
+        entries = _DRIVER_LIST_CACHE.get(dir_key)
+        if entries is None:
+            with os.scandir(_DRIVERS_DIR) as it:
+                entries = sorted(
+                    (entry.name[:-len('.json')], entry.path)
+                    for entry in it
+                    if entry.name.endswith('.json') and entry.is_file()
+                )
+            _DRIVER_LIST_CACHE.clear()
+            _DRIVER_LIST_CACHE[dir_key] = entries
+        
+        return entries
+    
     def _get_available_drivers(self) -> List[Tuple[str, Dict[str, Any]]]:
         """
         Get a list of all available device driver profiles.
@@ -209,27 +666,36 @@ class Config:
         Returns:
             List of tuples: (driver_name, driver_config)
         """
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        drivers_dir = os.path.join(current_dir, 'drivers')
-        
-        if not os.path.exists(drivers_dir):
-            return []
-        
         drivers = []
-        driver_files = glob.glob(os.path.join(drivers_dir, '*.json'))
-        
-        for driver_path in driver_files:
-            driver_name = os.path.splitext(os.path.basename(driver_path))[0]
+        for driver_name, driver_path in self._list_driver_files():
             try:
-                with open(driver_path, 'r') as f:
-                    driver_config = json.load(f)
-                    drivers.append((driver_name, driver_config))
+                drivers.append((driver_name, _cached_json_load(driver_path)))
             except Exception as e:
                 print(f"[Config] Warning: Could not load driver '{driver_name}': {e}")
                 continue
         
         return drivers
     
+    def _iter_driver_loaders(self) -> Iterator[Tuple[str, Callable[[], Optional[Dict[str, Any]]]]]:
+        """
+        Lazily yield available device driver profiles.
+        
+        Each driver file is only parsed when its loader is called, so a
+        consumer that stops at the first match never parses the rest.
+        
+        Yields:
+            Tuples of (driver_name, loader) where loader() returns the driver
+            configuration, or None if it could not be loaded
+        """
+        for driver_name, driver_path in self._list_driver_files():
+            def load(driver_name=driver_name, driver_path=driver_path) -> Optional[Dict[str, Any]]:
+                try:
+                    return _cached_json_load(driver_path)
+                except Exception as e:
+                    print(f"[Config] Warning: Could not load driver '{driver_name}': {e}")
+                    return None
+            yield driver_name, load
+    
     def _auto_detect_driver(self) -> Optional[str]:
         """
         Auto-detect which driver profile matches a connected HID device.
@@ -244,15 +710,12 @@ class Config:
             print("[Config] Error: Could not import finddevice module")
             return None
         
-        # Get all available driver profiles
-        available_drivers = self._get_available_drivers()
-        
-        if not available_drivers:
+        if not self._list_driver_files():
             print("[Config] No driver profiles found in drivers/ folder")
             return None
         
-        # Delegate to finddevice module
-        return auto_detect_device(available_drivers)
+        # Delegate to finddevice module; drivers are parsed only until one matches
+        return auto_detect_device(self._iter_driver_loaders())
     
     def _process_device_drivers(self, config_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -263,72 +726,72 @@ class Config:
         Otherwise, use the inline configuration.
         
         Args:
-            config_dict: Configuration dictionary to process
+            config_dict: Configuration dictionary to process (modified in place)
             
         Returns:
             Processed configuration with driver profiles loaded
         """
-        # Create a copy to avoid modifying the original
-        processed = config_dict.copy()
+        # Modified in place - __init__ owns this dict
+        processed = config_dict
+        
+        # Nothing to resolve unless drawingTablet is a driver reference (string);
+        # inline dicts and configs without a tablet section pass straight through
+        startup = processed.get('startupConfiguration')
+        if not isinstance(startup, dict) or not isinstance(startup.get('drawingTablet'), str):
+            return processed
+        
+        driver_name = startup['drawingTablet']
         
-        # Check if startupConfiguration exists
-        if 'startupConfiguration' in processed:
-            startup = processed['startupConfiguration']
+        # Handle auto-detection
+        if driver_name == 'auto-detect':
+            detected_driver = self._auto_detect_driver()
+            if detected_driver:
+                driver_name = detected_driver
+            else:
+                print(f"[Config] Auto-detection failed, using defaults")
+                del startup['drawingTablet']
+                return processed
+        else:
+            print(f"[Config] Loading device driver profile: {driver_name}")
+        
+        # Load the driver
+        driver_config = self._load_device_driver(driver_name)
+        
+        if driver_config:
+            tablet_config = self.build_tablet_config(driver_name, driver_config)
             
-            # Check if drawingTablet is a string (driver reference)
-            if 'drawingTablet' in startup and isinstance(startup['drawingTablet'], str):
-                driver_name = startup['drawingTablet']
-                
-                # Handle auto-detection
-                if driver_name == 'auto-detect':
-                    detected_driver = self._auto_detect_driver()
-                    if detected_driver:
-                        driver_name = detected_driver
-                    else:
-                        print(f"[Config] Auto-detection failed, using defaults")
-                        del processed['startupConfiguration']['drawingTablet']
-                        return processed
-                else:
-                    print(f"[Config] Loading device driver profile: {driver_name}")
-                
-                # Load the driver
-                driver_config = self._load_device_driver(driver_name)
-                
-                if driver_config:
-                    # Extract the relevant parts from the driver
-                    tablet_config = {}
-                    
-                    # Copy device identification info
-                    if 'deviceInfo' in driver_config:
-                        tablet_config.update(driver_config['deviceInfo'])
-                    
-                    # Copy byte code mappings
-                    if 'byteCodeMappings' in driver_config:
-                        tablet_config['byteCodeMappings'] = driver_config['byteCodeMappings']
-                    
-                    # Copy report ID (default to 2 if not specified)
-                    if 'reportId' in driver_config:
-                        tablet_config['reportId'] = driver_config['reportId']
-                    
-                    # Store driver metadata for reference
-                    tablet_config['_driverName'] = driver_name
-                    tablet_config['_driverInfo'] = {
-                        'name': driver_config.get('name'),
-                        'manufacturer': driver_config.get('manufacturer'),
-                        'model': driver_config.get('model')
-                    }
-                    
-                    # Replace the string reference with the loaded config
-                    # Don't merge with defaults - use driver config as-is
-                    processed['startupConfiguration']['drawingTablet'] = tablet_config
-                else:
-                    print(f"[Config] Failed to load driver '{driver_name}', using defaults")
-                    # Remove the invalid reference so defaults are used
-                    if 'startupConfiguration' in processed and 'drawingTablet' in processed['startupConfiguration']:
-                        del processed['startupConfiguration']['drawingTablet']
+            # Replace the string reference with the loaded config
+            # Don't merge with defaults - use driver config as-is
+            startup['drawingTablet'] = tablet_config
+        else:
+            print(f"[Config] Failed to load driver '{driver_name}', using defaults")
+            # Remove the invalid reference so defaults are used
+            del startup['drawingTablet']
         
         return processed
     
+    @staticmethod
+    def build_tablet_config(driver_name: str, driver_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build a drawingTablet config from a loaded driver profile.
+        
+        Device identification info is flattened into the top level, the
+        mapping fields are copied as-is and the driver metadata is kept
+        under '_driverInfo' for reference.
+        
+        Args:
+            driver_name: Driver profile name (file name without .json)
+            driver_config: Parsed driver profile
+            
+        Returns:
+            Drawing tablet configuration dictionary
+        """
+        tablet_config = dict(driver_config.get('deviceInfo', ()))
+        tablet_config.update((k, driver_config[k]) for k in _DRIVER_FIELDS if k in driver_config)
+        tablet_config['_driverName'] = driver_name
+        tablet_config['_driverInfo'] = {k: driver_config.get(k) for k in _DRIVER_META}
+        return tablet_config
+    
     def _expand_chord_progressions(self, config_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
         Expand chord progression preset references in tabletButtons configuration.
@@ -337,66 +800,92 @@ class Config:
         Otherwise, leave as-is to support custom button configurations.
         
         Args:
-            config_dict: Configuration dictionary to process
+            config_dict: Configuration dictionary to process (modified in place)
             
         Returns:
             Processed configuration with progressions expanded
         """
+        # Only progression names need expanding - skip the Note import otherwise
+        if not isinstance(config_dict.get('tabletButtons'), str):
+            return config_dict
+        
+        # Modified in place - __init__ owns this dict
+        processed = config_dict
+        progression_name = processed['tabletButtons']
+        
+        cached = _PROGRESSION_CACHE.get(progression_name)
+        if cached is not None:
+            print(f"[Config] Loading chord progression preset: {progression_name}")
+            # Hand out fresh lists so config edits can't alter the cache
+            processed['tabletButtons'] = {button: list(action) for button, action in cached.items()}
+            return processed
+        
         # Import here to avoid circular dependency
         from note import Note
         
         # Load chord progressions if not already loaded
         Note.load_chord_progressions()
         
-        # Create a copy to avoid modifying the original
-        processed = config_dict.copy()
-        
-        # Check if tabletButtons exists and is a string
-        if 'tabletButtons' in processed and isinstance(processed['tabletButtons'], str):
-            progression_name = processed['tabletButtons']
+        # Look up the progression
+        if progression_name in Note.chord_progressions:
+            chords = Note.chord_progressions[progression_name]
+            print(f"[Config] Loading chord progression preset: {progression_name}")
             
-            # Look up the progression
-            if progression_name in Note.chord_progressions:
-                chords = Note.chord_progressions[progression_name]
-                print(f"[Config] Loading chord progression preset: {progression_name}")
-                
-                # Expand to individual button actions (8 buttons)
-                # Wrap around if there are fewer chords than buttons
-                num_buttons = 8
-                expanded = {}
-                for i in range(1, num_buttons + 1):
-                    # Use modulo to wrap around to the beginning of the chord list
-                    chord_index = (i - 1) % len(chords)
-                    expanded[str(i)] = ["set-strum-chord", chords[chord_index]]
-                
-                processed['tabletButtons'] = expanded
-            else:
-                print(f"[Config] Unknown chord progression '{progression_name}', ignoring")
-                # Remove invalid reference
-                del processed['tabletButtons']
+            # Expand to individual button actions (8 buttons)
+            # Cycle to wrap around if there are fewer chords than buttons
+            wrapped_chords = itertools.islice(itertools.cycle(chords), len(_PROGRESSION_BUTTON_KEYS))
+            expanded = dict(zip(
+                _PROGRESSION_BUTTON_KEYS,
+                (["set-strum-chord", chord] for chord in wrapped_chords)
+            ))
+            
+            _PROGRESSION_CACHE[progression_name] = expanded
+            processed['tabletButtons'] = {button: list(action) for button, action in expanded.items()}
+        else:
+            print(f"[Config] Unknown chord progression '{progression_name}', ignoring")
+            # Remove invalid reference
+            del processed['tabletButtons']
         
         return processed
     
-    def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    def _deep_merge(self, base: Mapping[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deep merge two dictionaries, with override taking precedence.
         
+        Builds a new tree in a single pass using an explicit stack. Subtrees of
+        the base that are not overridden are copied once; overridden values are
+        taken from the override without copying the base first.
+        
         Args:
-            base: Base dictionary (defaults)
+            base: Base mapping (usually the frozen defaults)
             override: Dictionary with override values
             
         Returns:
             Merged dictionary
         """
-        result = base.copy()
+        result = {}
+        stack = [(result, base, override)]
         
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                # Override the value
-                result[key] = value
+        while stack:
+            dst, src, over = stack.pop()
+            for key, value in src.items():
+                if key not in over:
+                    # Not overridden - take a private copy of the base value
+                    dst[key] = _thaw(value)
+                    continue
+                
+                new_value = over[key]
+                if type(new_value) is dict and (type(value) is MappingProxyType or type(value) is dict):
+                    # Merge nested dictionaries on a later pass
+                    dst[key] = child = {}
+                    stack.append((child, value, new_value))
+                else:
+                    # Override the value
+                    dst[key] = new_value
+            
+            for key, value in over.items():
+                if key not in src:
+                    dst[key] = value
         
         return result
     
@@ -420,6 +909,7 @@ class Config:
     def __setitem__(self, key: str, value: Any) -> None:
         """Allow dictionary-style assignment."""
         self._config[key] = value
+        self._refresh_view()
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -429,19 +919,43 @@ class Config:
             key: Configuration key, may use dot notation (e.g., 'transpose.active')
             value: Value to set
         """
-        if '.' in key:
-            keys = key.split('.')
-            target = self._config
-            # Navigate to the nested dictionary
-            for k in keys[:-1]:
-                if k not in target:
-                    target[k] = {}
-                target = target[k]
-            # Set the final value
+        keys = _split_key(key)
+        target = self._config
+        # Navigate to the nested dictionary, creating levels as needed
+        for k in keys[:-1]:
+            target = target.setdefault(k, {})
+        # Set the final value
+        target[keys[-1]] = value
+        
+        self._refresh_view()
+    
+    def set_many(self, pairs: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Set several configuration values using dot notation.
+        
+        Nested dictionaries reached through a shared key prefix are only
+        traversed once, and the property view is rebuilt once at the end.
+        
+        Args:
+            pairs: Iterable of (key, value) tuples, keys may use dot notation
+        """
+        parents: Dict[Tuple[str, ...], Dict[str, Any]] = {(): self._config}
+        for key, value in pairs:
+            keys = _split_key(key)
+            prefix = keys[:-1]
+            target = parents.get(prefix)
+            if target is None:
+                target = self._config
+                for i, k in enumerate(prefix):
+                    target = target.setdefault(k, {})
+                    parents[prefix[:i + 1]] = target
             target[keys[-1]] = value
-        else:
-            # Direct key update
-            self._config[key] = value
+            if keys in parents:
+                # This value replaced a cached level - forget it and anything below
+                for cached in [p for p in parents if p[:len(keys)] == keys]:
+                    del parents[cached]
+        
+        self._refresh_view()
     
     def __contains__(self, key: str) -> bool:
         """Support 'in' operator."""
@@ -468,8 +982,8 @@ class Config:
         """
         try:
             path = Path(file_path)
-            with open(path, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            with open(path, 'wb') as f:
+                f.write(_json_dumps(self._config))
             print(f"Configuration saved to '{file_path}'")
             return True
         except Exception as e:
@@ -479,97 +993,117 @@ class Config:
     # Convenience properties for common config values
     
     @property
-    def device(self) -> Dict[str, Any]:
+    def device(self) -> Mapping[str, Any]:
         """Get drawing tablet device configuration."""
-        return self._config.get('startupConfiguration', {}).get('drawingTablet', {})
+        return self._view.device
     
     @property
     def use_socket_server(self) -> bool:
         """Get whether to use socket server."""
-        return self._config.get('startupConfiguration', {}).get('useSocketServer', True)
+        return self._view.use_socket_server
     
     @property
     def socket_server_port(self) -> int:
         """Get socket server port."""
-        return self._config.get('startupConfiguration', {}).get('socketServerPort', 8080)
+        return self._view.socket_server_port
     
     @property
     def use_web_server(self) -> bool:
         """Get whether to use HTTP web server."""
-        return self._config.get('startupConfiguration', {}).get('useWebServer', False)
+        return self._view.use_web_server
     
     @property
     def web_server_port(self) -> int:
         """Get HTTP web server port."""
-        return self._config.get('startupConfiguration', {}).get('webServerPort', 80)
+        return self._view.web_server_port
     
     @property
     def midi_input_id(self) -> Optional[str]:
         """Get MIDI input ID."""
-        return self._config.get('startupConfiguration', {}).get('midiInputId')
+        return self._view.midi_input_id
     
     @property
     def midi_output_id(self) -> Optional[str]:
         """Get MIDI output ID (rtmidi only)."""
-        return self._config.get('startupConfiguration', {}).get('midiOutputId')
+        return self._view.midi_output_id
     
     @property
     def midi_output_backend(self) -> str:
         """Get MIDI output backend (rtmidi or jack)."""
-        return self._config.get('startupConfiguration', {}).get('midiOutputBackend', 'rtmidi')
+        return self._view.midi_output_backend
     
     @property
     def jack_client_name(self) -> str:
         """Get Jack client name."""
-        return self._config.get('startupConfiguration', {}).get('jackClientName', 'midi_strummer')
+        return self._view.jack_client_name
     
     @property
     def jack_auto_connect(self) -> str:
         """Get Jack auto-connect mode."""
-        return self._config.get('startupConfiguration', {}).get('jackAutoConnect', 'chain0')
+        return self._view.jack_auto_connect
     
     @property
     def midi_strum_channel(self) -> Optional[int]:
         """Get MIDI strum channel."""
-        return self._config.get('strumming', {}).get('midiChannel')
+        return self._view.midi_strum_channel
     
     @property
     def initial_notes(self) -> list:
         """Get initial notes."""
-        return self._config.get('strumming', {}).get('initialNotes', ["C4", "E4", "G4"])
+        return self._view.initial_notes
     
     @property
     def upper_note_spread(self) -> int:
         """Get upper note spread."""
-        return self._config.get('strumming', {}).get('upperNoteSpread', 3)
+        return self._view.upper_note_spread
     
     @property
     def lower_note_spread(self) -> int:
         """Get lower note spread."""
-        return self._config.get('strumming', {}).get('lowerNoteSpread', 3)
+        return self._view.lower_note_spread
     
     @property
-    def note_duration(self) -> Dict[str, Any]:
+    def note_duration(self) -> Mapping[str, Any]:
         """Get note duration configuration."""
-        return self._config.get('noteDuration', {})
+        return self._view.note_duration
     
     @property
-    def pitch_bend(self) -> Dict[str, Any]:
+    def pitch_bend(self) -> Mapping[str, Any]:
         """Get pitch bend configuration."""
-        return self._config.get('pitchBend', {})
+        return self._view.pitch_bend
     
     @property
-    def note_velocity(self) -> Dict[str, Any]:
+    def note_velocity(self) -> Mapping[str, Any]:
         """Get note velocity configuration."""
-        return self._config.get('noteVelocity', {})
+        return self._view.note_velocity
     
     @property
-    def mappings(self) -> Dict[str, Any]:
+    def mappings(self) -> Mapping[str, Any]:
         """Get HID byte code mappings."""
-        return self._config.get('startupConfiguration', {}).get('drawingTablet', {}).get('byteCodeMappings', {})
+        return self._view.mappings
+    
+    @property
+    def compiled_mappings(self) -> Tuple[CompiledMapping, ...]:
+        """Get HID byte code mappings compiled into fixed-layout rows."""
+        return self._mapping_arr
+    
+    @property
+    def status_mapping(self) -> Optional[CompiledMapping]:
+        """Get the compiled status code mapping, if any."""
+        return self._status_mapping
+    
+    @property
+    def status_lut(self) -> Optional[Tuple[Any, ...]]:
+        """Get the 256-entry status byte -> state lookup table, if any."""
+        return self._status_lut
+    
+    @property
+    def revision(self) -> int:
+        """Get a counter that increases on every change made through Config (for caching lookups)."""
+        return self._revision
     
     @property
     def report_id(self) -> int:
         """Get HID Report ID (default to 2 if not specified)."""
-        return self._config.get('startupConfiguration', {}).get('drawingTablet', {}).get('reportId', 2)
+        return self._view.report_id
 
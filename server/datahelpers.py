@@ -1,8 +1,8 @@
 import math
-from typing import List, Union, Dict, Any
+from typing import List, Union, Dict, Any, Sequence, Callable
 
 
-def parse_range_data(data: List[int], byte_index: int, min_val: int = 0, max_val: int = 0) -> float:
+def parse_range_data(data: Sequence[int], byte_index: int, min_val: int = 0, max_val: int = 0) -> float:
     """Parse range data from byte array"""
     value = data[byte_index]
     if max_val == min_val:
@@ -10,7 +10,7 @@ def parse_range_data(data: List[int], byte_index: int, min_val: int = 0, max_val
     return (value - min_val) / (max_val - min_val)
 
 
-def parse_multi_byte_range_data(data: List[int], byte_indices: List[int], 
+def parse_multi_byte_range_data(data: Sequence[int], byte_indices: List[int], 
                                  min_val: int = 0, max_val: int = 0, debug_name: str = None) -> float:
     """
     Parse multi-byte range data from byte array.
@@ -19,7 +19,7 @@ def parse_multi_byte_range_data(data: List[int], byte_indices: List[int],
     For example, for 14-bit pressure: value = low_byte + (high_byte << 8)
     
     Args:
-        data: List of byte values
+        data: Byte values (bytes, bytearray, memoryview or list of ints)
         byte_indices: List of byte indices to combine [low_byte_index, high_byte_index, ...]
         min_val: Minimum value in the combined range
         max_val: Maximum value in the combined range
@@ -49,7 +49,7 @@ def parse_multi_byte_range_data(data: List[int], byte_indices: List[int],
     return normalized
 
 
-def parse_bipolar_range_data(data: List[int], byte_index: int, 
+def parse_bipolar_range_data(data: Sequence[int], byte_index: int, 
                            pos_min: int = 0, pos_max: int = 0, 
                            neg_min: int = 0, neg_max: int = 0) -> float:
     """
@@ -70,7 +70,7 @@ def parse_bipolar_range_data(data: List[int], byte_index: int,
         return -(neg_min - value) / (neg_min - neg_max)
 
 
-def parse_code(data: List[int], byte_index: int, values) -> Union[int, float, dict]:
+def parse_code(data: Sequence[int], byte_index: int, values) -> Union[int, float, dict]:
     """Parse code from byte array using lookup values (dict or list)"""
     code = data[byte_index]
     
@@ -88,7 +88,7 @@ def parse_code(data: List[int], byte_index: int, values) -> Union[int, float, di
     return 0
 
 
-def parse_bit_flags(data: List[int], byte_index: int, button_count: int = 8) -> Dict[str, bool]:
+def parse_bit_flags(data: Sequence[int], byte_index: int, button_count: int = 8) -> Dict[str, bool]:
     """
     Parse bit flags from a byte into individual button states.
     
@@ -96,7 +96,7 @@ def parse_bit_flags(data: List[int], byte_index: int, button_count: int = 8) ->
     For example, byte value 5 (binary 0b00000101) means buttons 1 and 3 are pressed.
     
     Args:
-        data: List of byte values
+        data: Byte values (bytes, bytearray, memoryview or list of ints)
         byte_index: Index of the byte containing button flags
         button_count: Number of buttons to parse (default: 8)
         
@@ -259,3 +259,77 @@ def apply_effect(effect_config: Dict[str, Any], control_inputs: Dict[str, float]
         effect_config.get('curve', 1.0),
         effect_config.get('spread', 'direct')
     )
+
+
+def compile_effect(effect_config: Dict[str, Any]) -> Callable[[Dict[str, float]], float]:
+    """
+    Compile an effect configuration into a function of the control inputs.
+    
+    The returned function gives the same result as calling apply_effect() with
+    this configuration, but the config lookups, curve denominator and output
+    span are resolved once here instead of on every call. Recompile whenever
+    the effect configuration changes.
+    
+    Args:
+        effect_config: Effect configuration dictionary (see apply_effect)
+        
+    Returns:
+        Function taking the control inputs dictionary and returning the effect value
+        
+    Example:
+        >>> velocity_fn = compile_effect({'control': 'pressure', 'min': 0, 'max': 127, 'default': 64})
+        >>> velocity_fn({'pressure': 0.5})
+        63.5
+    """
+    control_type = effect_config.get('control')
+    default = effect_config.get('default', 0.0)
+    
+    if not control_type:
+        return lambda control_inputs: default
+    
+    min_val = effect_config.get('min', 0.0)
+    max_val = effect_config.get('max', 1.0)
+    multiplier = effect_config.get('multiplier', 1.0)
+    curve = effect_config.get('curve', 1.0)
+    spread = effect_config.get('spread', 'direct')
+    span = max_val - min_val
+    
+    # Specialized apply_curve() over the fixed 0-1 input range
+    if curve == 1.0:
+        def shape(value: float) -> float:
+            if value <= 0.0:
+                return 0.0
+            if value >= 1.0:
+                return 1.0
+            return value
+    else:
+        exp = math.exp
+        denominator = exp(curve) - 1
+        
+        def shape(value: float) -> float:
+            if value <= 0.0:
+                return 0.0
+            if value >= 1.0:
+                return 1.0
+            return (exp(curve * value) - 1) / denominator
+    
+    if spread == "central":
+        def effect(control_inputs: Dict[str, float]) -> float:
+            if control_type not in control_inputs:
+                return default
+            scaled_input = max(0.0, min(1.0, control_inputs[control_type] * multiplier))
+            return max_val - (shape(abs(scaled_input - 0.5) * 2.0) * span)
+    elif spread == "inverse":
+        def effect(control_inputs: Dict[str, float]) -> float:
+            if control_type not in control_inputs:
+                return default
+            scaled_input = max(0.0, min(1.0, control_inputs[control_type] * multiplier))
+            return max_val - (shape(scaled_input) * span)
+    else:  # "direct" or default
+        def effect(control_inputs: Dict[str, float]) -> float:
+            if control_type not in control_inputs:
+                return default
+            scaled_input = max(0.0, min(1.0, control_inputs[control_type] * multiplier))
+            return min_val + (shape(scaled_input) * span)
+    
+    return effect
@@ -7,9 +7,16 @@ Helps users create driver configuration files for new drawing tablets and HID de
 
 import sys
 import os
+import copy
+import hashlib
 import json
 import time
-from typing import Dict, Any, List, Tuple, Optional
+import atexit
+import struct
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Tuple, Optional, Union, Callable, Sequence
 
 # Add parent directory to path to import from server
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'server'))
@@ -22,15 +29,190 @@ except ImportError:
     sys.exit(1)
 
 
+# Leading byte positions summarized per interface while monitoring
+_HISTOGRAM_BYTES = 16
+
+# Raw packets kept per interface while monitoring (most recent only)
+_SAMPLE_TAIL = 200
+
+# Upper bound on stale reports discarded before a capture (a streaming device
+# never runs its queue dry)
+_DRAIN_MAX_REPORTS = 1024
+
+# Single-bit byte values, as produced by one pressed button in a bit-flag byte
+_BIT_FLAGS = frozenset((1, 2, 4, 8, 16, 32, 64, 128))
+
+# Status codes used by most tablets, mapped to their config entries
+_KNOWN_STATUS_CODES = {
+    0xC0: {"state": "none"},
+    0xA0: {"state": "hover"},
+    0xA2: {"state": "hover", "secondaryButtonPressed": True},
+    0xA4: {"state": "hover", "primaryButtonPressed": True},
+    0xA1: {"state": "contact"},
+    0xA3: {"state": "contact", "secondaryButtonPressed": True},
+    0xA5: {"state": "contact", "primaryButtonPressed": True},
+    0xF0: {"state": "buttons"},
+}
+
+# Driver configs from previous runs, keyed by "vid:pid:interfaces"
+_DISCOVERED_FILE = os.path.join(os.path.expanduser('~'), '.strumboli', 'discovered.json')
+
+# Captured reports are padded/truncated to this width so every sample has the same layout
+_REPORT_WIDTH = 64
+
+# Detected byte mappings keyed by a digest of the capture they came from, so
+# re-analyzing an unchanged capture skips detection (oldest entry evicted first)
+_MAPPINGS_CACHE: Dict[bytes, Dict[str, Any]] = {}
+_MAPPINGS_CACHE_SIZE = 32
+
+
+# Sample analysis kernels. Samples are fixed-width bytes rows joined into one
+# buffer, so every kernel reduces to strided slices, set/struct calls and
+# min/max, all of which run in C. They deliberately stay stdlib-only: this
+# tool ships as a PyInstaller binary, and NumPy/Numba would add a large
+# runtime (and JIT cache files that do not survive freezing) for analysis
+# that takes milliseconds next to the interactive capture steps.
+
+def _histogram_values(row: List[int]) -> List[int]:
+    """Return the byte values seen at least once in a histogram row, ascending."""
+    return [value for value, count in enumerate(row) if count]
+
+
+def _pad_report(data: Union[bytes, List[int]]) -> bytes:
+    """Convert a HID read into a fixed-width bytes sample (zero-padded to _REPORT_WIDTH)."""
+    return bytes(data[:_REPORT_WIDTH]).ljust(_REPORT_WIDTH, b'\x00')
+
+
+def _sample_matrix(samples: List[bytes]) -> bytes:
+    """
+    Join fixed-width samples into one contiguous row-major buffer.
+    
+    Column i of the matrix is then buf[i::_REPORT_WIDTH], a single C-level
+    strided copy instead of a Python loop over every sample.
+    """
+    return b''.join(samples)
+
+
+def _value_mask(column: bytes) -> int:
+    """Return the distinct byte values in a column as a 256-bit mask (bit v set = v seen)."""
+    mask = 0
+    for value in set(column):
+        mask |= 1 << value
+    return mask
+
+
+def _mask_values(mask: int) -> List[int]:
+    """Return the byte values set in a value mask, ascending."""
+    values = []
+    while mask:
+        low_bit = mask & -mask
+        values.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return values
+
+
+def _capture_digest(report_length: int, groups: Sequence[Optional[List[bytes]]]) -> bytes:
+    """
+    Hash a capture (every sample group plus the report length) into a cache key.
+    
+    Each group contributes its sample count and joined bytes; samples are
+    fixed-width, so the encoding is unambiguous.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(report_length.to_bytes(2, 'little'))
+    for samples in groups:
+        samples = samples or []
+        digest.update(len(samples).to_bytes(4, 'little'))
+        digest.update(_sample_matrix(samples))
+    return digest.digest()
+
+
+def _u16_windows(buf: bytes) -> Callable[[int], Tuple[int, ...]]:
+    """
+    Little-endian 16-bit values at every byte offset of every sample in a matrix.
+    
+    The whole matrix is decoded by two struct.unpack calls, one for the
+    even-aligned byte pairs and one for the odd-aligned pairs, so every
+    (byte_idx, byte_idx+1) window is available without per-sample or
+    per-offset arithmetic in Python. The result does not depend on the host
+    byte order.
+    
+    Returns:
+        Function mapping a byte index to the tuple of 16-bit values at that
+        offset, one per sample
+    """
+    half = len(buf) // 2
+    even = struct.unpack(f'<{half}H', buf)
+    odd = struct.unpack(f'<{half - 1}H', buf[1:-1]) if half else ()
+    stride = _REPORT_WIDTH // 2
+    
+    def column(byte_idx: int) -> Tuple[int, ...]:
+        # Row r's pair at byte_idx starts at r*_REPORT_WIDTH + byte_idx in either array
+        return (odd if byte_idx & 1 else even)[byte_idx // 2::stride]
+    
+    return column
+
+
+def _compile_parser(mappings: Dict[str, Any]) -> Callable[[bytes], Dict[str, int]]:
+    """
+    Generate a raw decoder with the detected byte offsets baked in.
+    
+    The source is built once per layout (e.g. "'x': buf[2] | (buf[3] << 8)"),
+    so decoding a report is a single dict display with constant indices and
+    no mapping lookups. Values are raw, unscaled integers.
+    
+    Args:
+        mappings: Detected byteCodeMappings
+        
+    Returns:
+        parse(buf) function returning {mapping_key: raw_value}
+    """
+    fields = []
+    for key, mapping in mappings.items():
+        if not isinstance(mapping, dict):
+            continue
+        mapping_type = mapping.get('type')
+        if mapping_type == 'multi-byte-range':
+            byte_indices = mapping.get('byteIndices') or ()
+            if len(byte_indices) < 2:
+                continue  # Not a low/high byte pair - nothing to bake in
+            lo, hi = int(byte_indices[0]), int(byte_indices[1])
+            fields.append(f"{key!r}: buf[{lo}] | (buf[{hi}] << 8)")
+        elif mapping_type in ('code', 'bipolar-range', 'bit-flags', 'range'):
+            byte_index = mapping.get('byteIndex')
+            if byte_index is None:
+                continue
+            fields.append(f"{key!r}: buf[{int(byte_index)}]")
+    
+    source = "def parse(buf):\n    return {" + ", ".join(fields) + "}\n"
+    namespace = {}
+    exec(compile(source, '<discovered-parser>', 'exec'), namespace)
+    return namespace['parse']
+
+
 class DeviceDiscovery:
     """Interactive device discovery wizard"""
     
     def __init__(self):
         self.selected_device = None
+        self.selected_vid = None
+        self.selected_pid = None
         self.device_info = None
         self.interfaces = []
         self.report_ids = {}
         self.driver_config = {}
+        self.device_groups = {}
+        self.report_length = 0  # Longest raw report seen on the interface being analyzed
+        self.byte_mappings = {}
+        self.reused_config = False
+        self._fast_parse = None  # Raw decoder specialized for the last analyzed layout
+        self._enum_cache = None  # (timestamp, device list) from the last hid.enumerate()
+        # Interface handles opened in Step 2 and kept until analysis is done,
+        # so each interface is only opened (and its descriptors fetched) once.
+        # Keyed by HID path: on Windows/macOS each top-level collection is its
+        # own entry and several can share one interface_number
+        self._open_handles: Dict[Any, Any] = {}
+        atexit.register(self._close_all)
         
     def run(self):
         """Run the interactive discovery process"""
@@ -43,17 +225,19 @@ class DeviceDiscovery:
         if not self.select_device():
             return
         
-        # Step 2: Discover interfaces
-        if not self.discover_interfaces():
-            return
-        
-        # Step 3: Analyze data from each interface
-        if not self.analyze_interfaces():
-            return
-        
-        # Step 4: Build driver config
-        if not self.build_driver_config():
-            return
+        # Steps 2-4 are skipped when a previously discovered config is reused
+        if not self.reused_config:
+            # Step 2: Discover interfaces
+            if not self.discover_interfaces():
+                return
+            
+            # Step 3: Analyze data from each interface
+            if not self.analyze_interfaces():
+                return
+            
+            # Step 4: Build driver config
+            if not self.build_driver_config():
+                return
         
         # Step 5: Save driver
         self.save_driver()
@@ -62,12 +246,30 @@ class DeviceDiscovery:
         print("   Discovery Complete!")
         print("="*70)
         
+    def _cached_enumerate(self, ttl: float = 5.0) -> List[Dict[str, Any]]:
+        """
+        Enumerate all HID devices, reusing the previous scan for up to ttl seconds.
+        
+        A full hid.enumerate() queries string descriptors from every device on
+        the bus, which is slow, so repeated lookups within the same wizard step
+        share one scan.
+        """
+        now = time.monotonic()
+        if self._enum_cache is not None:
+            timestamp, devices = self._enum_cache
+            if now - timestamp < ttl:
+                return devices
+        
+        devices = hid.enumerate()
+        self._enum_cache = (now, devices)
+        return devices
+    
     def select_device(self) -> bool:
         """List devices and let user select one"""
         print("\n[Step 1] Scanning for HID devices...")
         
         try:
-            devices = hid.enumerate()
+            devices = self._cached_enumerate()
         except Exception as e:
             print(f"Error enumerating devices: {e}")
             return False
@@ -80,9 +282,8 @@ class DeviceDiscovery:
         device_groups = {}
         for device in devices:
             key = (device['vendor_id'], device['product_id'])
-            if key not in device_groups:
-                device_groups[key] = []
-            device_groups[key].append(device)
+            device_groups.setdefault(key, []).append(device)
+        self.device_groups = device_groups
         
         print(f"\nFound {len(device_groups)} unique device(s):\n")
         
@@ -109,9 +310,11 @@ class DeviceDiscovery:
                 if 0 <= idx < len(device_list):
                     (vid, pid), group = device_list[idx]
                     self.selected_device = (vid, pid)
+                    self.selected_vid, self.selected_pid = vid, pid
                     self.device_info = group[0]
                     self.interfaces = group
                     print(f"\n✓ Selected: {self.device_info.get('product_string', 'Device')}")
+                    self._offer_previous_config(vid, pid)
                     return True
                 else:
                     print("Invalid selection. Try again.")
@@ -119,6 +322,124 @@ class DeviceDiscovery:
                 print("\nCancelled.")
                 return False
     
+    @staticmethod
+    def _load_discovered() -> Dict[str, Any]:
+        """Load driver configs saved by previous runs (empty dict if none)."""
+        try:
+            with open(_DISCOVERED_FILE, 'r') as f:
+                discovered = json.load(f)
+            return discovered if isinstance(discovered, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Warning: could not read {_DISCOVERED_FILE}: {e}")
+            return {}
+    
+    def _offer_previous_config(self, vid: int, pid: int) -> None:
+        """
+        Offer to reuse a driver config discovered for this VID/PID on an earlier run.
+        
+        Accepting skips interface monitoring, the interactive tests and the
+        config questions; the saved config goes straight to Step 5.
+        """
+        prefix = f"{vid:04x}:{pid:04x}:"
+        matches = [(key, config) for key, config in self._load_discovered().items()
+                   if key.startswith(prefix) and isinstance(config, dict)]
+        if not matches:
+            return
+        
+        # Most recently saved entry wins
+        key, config = matches[-1]
+        interfaces = key[len(prefix):] or 'unknown'
+        print(f"\nFound a previously discovered configuration: {config.get('name', 'Unknown')} "
+              f"(interfaces {interfaces})")
+        
+        try:
+            choice = input("Reuse existing config? [Y/n]: ").strip().lower()
+        except KeyboardInterrupt:
+            print()
+            return
+        
+        if choice in ('', 'y', 'yes'):
+            self.driver_config = config
+            self.byte_mappings = config.get('byteCodeMappings', {})
+            self.reused_config = True
+            print("✓ Reusing saved configuration")
+    
+    def _remember_discovered(self) -> None:
+        """Persist the current driver config so later runs can reuse it."""
+        vid = self.device_info['vendor_id']
+        pid = self.device_info['product_id']
+        interfaces = self.driver_config.get('deviceInfo', {}).get('interfaces', [])
+        key = f"{vid:04x}:{pid:04x}:{','.join(str(i) for i in interfaces)}"
+        
+        discovered = self._load_discovered()
+        # Re-insert so the newest entry for a device is last
+        discovered.pop(key, None)
+        discovered[key] = self.driver_config
+        
+        try:
+            os.makedirs(os.path.dirname(_DISCOVERED_FILE), exist_ok=True)
+            with open(_DISCOVERED_FILE, 'w') as f:
+                json.dump(discovered, f, indent=2)
+        except Exception as e:
+            print(f"Warning: could not update {_DISCOVERED_FILE}: {e}")
+    
+    def _refresh_interfaces(self) -> None:
+        """
+        Re-read the selected device's interfaces just before they are opened.
+        
+        Uses the VID/PID-filtered form of hid.enumerate(), which skips the
+        descriptor queries for every other device on the bus. Only interfaces
+        already in self.interfaces are kept.
+        """
+        try:
+            current = hid.enumerate(self.selected_vid, self.selected_pid)
+        except Exception as e:
+            print(f"Warning: could not refresh interfaces: {e}")
+            return
+        
+        if not current:
+            # Keep the previous list; opening the interfaces will report the problem
+            return
+        
+        wanted = {d.get('interface_number', -1) for d in self.interfaces}
+        self.interfaces = [d for d in current if d.get('interface_number', -1) in wanted]
+    
+    @staticmethod
+    def _handle_key(device_info: Dict[str, Any]) -> Any:
+        """Key for an interface's cached handle: its HID path, or VID/PID when there is none."""
+        return device_info.get('path') or (device_info['vendor_id'], device_info['product_id'])
+    
+    def _open_interface(self, device_info: Dict[str, Any]) -> Any:
+        """
+        Return the open handle for an interface, opening it on first use.
+        
+        Not thread-safe: open every handle before handing them to worker threads.
+        """
+        key = self._handle_key(device_info)
+        device = self._open_handles.get(key)
+        if device is None:
+            device = hid.device()
+            if 'path' in device_info and device_info['path']:
+                device.open_path(device_info['path'])
+            else:
+                device.open(device_info['vendor_id'], device_info['product_id'])
+            self._open_handles[key] = device
+        return device
+    
+    def _close_interfaces(self, keep: Tuple[Any, ...] = ()) -> None:
+        """Close open interface handles, except the handle keys in keep (see _handle_key)."""
+        for key in [k for k in self._open_handles if k not in keep]:
+            try:
+                self._open_handles.pop(key).close()
+            except Exception:
+                pass
+    
+    def _close_all(self) -> None:
+        """Close every open interface handle."""
+        self._close_interfaces()
+    
     def discover_interfaces(self) -> bool:
         """Discover which interfaces are usable and what they do"""
         print("\n[Step 2] Discovering interfaces...")
@@ -132,6 +453,7 @@ class DeviceDiscovery:
         input("\nPress ENTER to start monitoring all interfaces...")
         
         # Monitor all interfaces simultaneously
+        self._refresh_interfaces()
         print("\nMonitoring... perform actions now!\n")
         interface_data = self._monitor_all_interfaces()
         
@@ -150,31 +472,36 @@ class DeviceDiscovery:
             data = interface_data.get(interface_num, {})
             sample_count = data.get('sample_count', 0)
             
-            print(f"\nInterface {interface_num}:")
-            print(f"  Usage Page: 0x{usage_page:04x}, Usage: 0x{usage:04x}")
+            # Collect the interface's summary and write it out in one call
+            lines = [
+                f"\nInterface {interface_num}:",
+                f"  Usage Page: 0x{usage_page:04x}, Usage: 0x{usage:04x}",
+            ]
             
             if sample_count == 0:
-                print(f"  Status: ✗ No data received")
+                lines.append("  Status: ✗ No data received")
+                print("\n".join(lines))
                 continue
             
             report_ids = data.get('report_ids', [])
-            print(f"  Status: ✓ {sample_count} packets")
-            print(f"  Report ID(s): {report_ids}")
+            lines.append(f"  Status: ✓ {sample_count} packets")
+            lines.append(f"  Report ID(s): {report_ids}")
             
             # Analyze what this interface does
-            characteristics = self._analyze_interface_characteristics(data.get('samples', []))
+            characteristics = self._analyze_interface_characteristics(data)
             
-            print(f"  Characteristics:")
+            lines.append("  Characteristics:")
             if characteristics['has_coordinates']:
-                print(f"    → STYLUS interface (coordinates/movement detected)")
+                lines.append("    → STYLUS interface (coordinates/movement detected)")
             if characteristics['has_buttons']:
-                print(f"    → BUTTON interface (bit patterns detected)")
+                lines.append("    → BUTTON interface (bit patterns detected)")
             if characteristics['has_varying_pressure']:
-                print(f"    → Pressure data detected")
+                lines.append("    → Pressure data detected")
             if characteristics['is_event_based']:
-                print(f"    → Event-based (only sends when active)")
+                lines.append("    → Event-based (only sends when active)")
             if not any(characteristics.values()):
-                print(f"    → Unknown/other interface")
+                lines.append("    → Unknown/other interface")
+            print("\n".join(lines))
             
             self.report_ids[interface_num] = report_ids
             usable_interfaces.append(interface_num)
@@ -214,73 +541,102 @@ class DeviceDiscovery:
                                  if d.get('interface_number', -1) in usable_interfaces]
                 break
         
+        # Keep handles only for the interfaces that will be analyzed
+        self._close_interfaces(keep=tuple(self._handle_key(d) for d in self.interfaces))
+        
         return True
     
-    def _monitor_all_interfaces(self) -> Dict[int, Dict]:
+    def _monitor_all_interfaces(self, duration: float = 10.0) -> Dict[int, Dict]:
         """Monitor all interfaces simultaneously for a brief period"""
-        import threading
-        
         results = {}
-        threads = []
+        if not self.interfaces:
+            return results
         
-        def monitor_interface(device_info, results_dict):
+        # One monotonic deadline shared by every worker so they all stop on the same tick
+        deadline = time.monotonic() + duration
+        stop_event = threading.Event()
+        
+        def monitor_interface(device_info, test_device, open_error):
             interface_num = device_info.get('interface_number', -1)
             try:
-                test_device = hid.device()
-                if 'path' in device_info and device_info['path']:
-                    test_device.open_path(device_info['path'])
-                else:
-                    test_device.open(device_info['vendor_id'], device_info['product_id'])
+                if open_error is not None:
+                    raise open_error
                 
-                test_device.set_nonblocking(True)
-                
-                samples = []
+                # Stream a per-byte value histogram instead of keeping every packet;
+                # only a bounded tail of raw packets is retained
+                histogram = [[0] * 256 for _ in range(_HISTOGRAM_BYTES)]
+                tail = deque(maxlen=_SAMPLE_TAIL)
+                sample_count = 0
+                report_length = 0
                 report_ids = set()
-                start_time = time.time()
                 
-                while time.time() - start_time < 10.0:
-                    data = test_device.read(64)
-                    if data and len(data) > 0:
-                        data_list = list(data)
-                        samples.append(data_list)
+                while not stop_event.is_set():
+                    remaining_ms = int((deadline - time.monotonic()) * 1000)
+                    if remaining_ms <= 0:
+                        break
+                    # Blocking read: wakes as soon as a report arrives, and at
+                    # least every 100ms so a cancelled run stops promptly
+                    data = test_device.read(64, min(remaining_ms, 100))
+                    if data:
+                        # hidapi already returns a fresh list per read; use it as-is
+                        if not sample_count:
+                            report_length = len(data)
+                        sample_count += 1
+                        tail.append(_pad_report(data))
+                        for row, value in zip(histogram, data):
+                            row[value] += 1
                         if data[0] > 0:
                             report_ids.add(data[0])
-                    time.sleep(0.01)
-                
-                test_device.close()
                 
-                results_dict[interface_num] = {
-                    'sample_count': len(samples),
+                return interface_num, {
+                    'sample_count': sample_count,
                     'report_ids': sorted(report_ids),
-                    'samples': samples
+                    'report_length': report_length,
+                    'histogram': histogram,
+                    'samples': list(tail)
                 }
                 
             except Exception as e:
-                results_dict[interface_num] = {
+                return interface_num, {
                     'sample_count': 0,
                     'report_ids': [],
+                    'report_length': 0,
+                    'histogram': [],
                     'samples': [],
                     'error': str(e)
                 }
         
-        # Start monitoring all interfaces in parallel
+        # Open every handle up front so the workers never touch the handle cache
+        opened = []
         for device_info in self.interfaces:
-            thread = threading.Thread(
-                target=monitor_interface,
-                args=(device_info, results)
-            )
-            thread.start()
-            threads.append(thread)
+            try:
+                opened.append((device_info, self._open_interface(device_info), None))
+            except Exception as e:
+                opened.append((device_info, None, e))
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        # Monitor all interfaces in parallel
+        with ThreadPoolExecutor(max_workers=len(self.interfaces)) as executor:
+            futures = [executor.submit(monitor_interface, device_info, test_device, open_error)
+                       for device_info, test_device, open_error in opened]
+            try:
+                for future in as_completed(futures):
+                    interface_num, result = future.result()
+                    results[interface_num] = result
+            except KeyboardInterrupt:
+                stop_event.set()
+                raise
         
         return results
     
-    def _analyze_interface_characteristics(self, samples: List[List[int]]) -> Dict[str, bool]:
-        """Analyze samples to determine what the interface does"""
-        if not samples or len(samples) < 3:
+    def _analyze_interface_characteristics(self, data: Dict[str, Any]) -> Dict[str, bool]:
+        """
+        Analyze a monitoring summary to determine what the interface does.
+        
+        Per-byte ranges and distinct values come from the streamed histogram,
+        which covers every packet; 16-bit checks use the raw sample tail.
+        """
+        sample_count = data.get('sample_count', 0)
+        if sample_count < 3:
             return {
                 'has_coordinates': False,
                 'has_buttons': False,
@@ -292,41 +648,45 @@ class DeviceDiscovery:
             'has_coordinates': False,
             'has_buttons': False,
             'has_varying_pressure': False,
-            'is_event_based': len(samples) < 50  # Few samples = event-based
+            'is_event_based': sample_count < 50  # Few samples = event-based
         }
         
+        histogram = data['histogram']
+        first_len = min(data['report_length'], len(histogram))
+        
         # Check for coordinates (high variance in certain bytes = X/Y movement)
-        if len(samples) >= 5:
-            for byte_idx in range(2, min(8, len(samples[0]))):
-                values = [s[byte_idx] for s in samples if len(s) > byte_idx]
-                if values and (max(values) - min(values)) > 20:
+        if sample_count >= 5:
+            for byte_idx in range(2, min(8, first_len)):
+                seen = _histogram_values(histogram[byte_idx])
+                if seen[-1] - seen[0] > 20:
                     characteristics['has_coordinates'] = True
                     break
         
         # Check for button patterns (bit flags)
-        for byte_idx in range(1, min(4, len(samples[0]) if samples else 0)):
-            values = [s[byte_idx] for s in samples if len(s) > byte_idx]
-            unique_values = set(values)
+        for byte_idx in range(1, min(4, first_len)):
+            unique_values = _histogram_values(histogram[byte_idx])
             # Button byte often has powers of 2 or combinations
             if len(unique_values) >= 2:
                 # Check if values look like bit flags (1, 2, 4, 8, 16, etc.)
-                bit_like = sum(1 for v in unique_values if v in [1, 2, 4, 8, 16, 32, 64, 128])
+                bit_like = sum(1 for v in unique_values if v in _BIT_FLAGS)
                 if bit_like >= 2:
                     characteristics['has_buttons'] = True
                     break
         
         # Check for varying pressure (16-bit values that increase/decrease)
-        if len(samples) >= 5:
-            for byte_idx in range(4, min(10, len(samples[0]) if samples else 0)):
-                if byte_idx + 1 < len(samples[0] if samples else []):
-                    values = [s[byte_idx] + (s[byte_idx+1] << 8) for s in samples 
-                             if len(s) > byte_idx + 1]
-                    if values:
-                        val_range = max(values) - min(values)
-                        # Pressure has significant range
-                        if val_range > 100 and min(values) < max(values) * 0.5:
-                            characteristics['has_varying_pressure'] = True
-                            break
+        samples = data['samples']
+        if sample_count >= 5 and len(samples) >= 5:
+            u16_at = _u16_windows(_sample_matrix(samples))
+            first_len = data['report_length']
+            for byte_idx in range(4, min(10, first_len)):
+                if byte_idx + 1 < first_len:
+                    values = u16_at(byte_idx)
+                    max_val = max(values)
+                    min_val = min(values)
+                    # Pressure has significant range
+                    if max_val - min_val > 100 and min_val < max_val * 0.5:
+                        characteristics['has_varying_pressure'] = True
+                        break
         
         return characteristics
     
@@ -339,6 +699,8 @@ class DeviceDiscovery:
         
         input("\nPress ENTER when ready to continue...")
         
+        self._refresh_interfaces()
+        
         # Analyze each interface
         self.byte_mappings = {}
         
@@ -354,6 +716,9 @@ class DeviceDiscovery:
                 print(f"Error analyzing interface {interface_num}: {e}")
                 continue
         
+        # Interface handles are not needed after the interactive tests
+        self._close_all()
+        
         if not self.byte_mappings:
             print("\n⚠ No mappings detected. You'll need to configure manually.")
             return True
@@ -366,15 +731,10 @@ class DeviceDiscovery:
         interface_num = device_info.get('interface_number', -1)
         
         try:
-            device = hid.device()
-            if 'path' in device_info and device_info['path']:
-                device.open_path(device_info['path'])
-            else:
-                device.open(device_info['vendor_id'], device_info['product_id'])
-            
-            device.set_nonblocking(True)
+            device = self._open_interface(device_info)
             
             mappings = {}
+            self.report_length = 0
             
             # Test 1: Detect baseline (stylus away)
             print("\n1. Keep stylus AWAY from tablet")
@@ -443,8 +803,6 @@ class DeviceDiscovery:
             print("    (Press, hold briefly, release, then next button)")
             button_data = self._capture_samples(device, "Pressing buttons", duration=10)
             
-            device.close()
-            
             # Analyze collected data
             print("\nAnalyzing data...")
             mappings = self._analyze_samples(
@@ -458,36 +816,91 @@ class DeviceDiscovery:
             print(f"Error during analysis: {e}")
             return None
     
-    def _capture_samples(self, device, action: str, duration: int = 3) -> List[List[int]]:
-        """Capture data samples during an action"""
+    def _capture_samples(self, device, action: str, duration: int = 3) -> List[bytes]:
+        """
+        Capture data samples during an action.
+        
+        Each report is stored as fixed-width bytes (see _REPORT_WIDTH) so the
+        analysis helpers can slice byte columns without per-sample length checks.
+        """
         input(f"   Press ENTER and then {action}...")
         
+        # The handle stays open between steps, so discard reports queued while
+        # waiting at the prompt - they belong to the previous action. Handles are
+        # in blocking mode (read(n, 0) would wait for a report), so switch to
+        # non-blocking for the drain and cap it in case the device keeps streaming
+        device.set_nonblocking(True)
+        try:
+            for _ in range(_DRAIN_MAX_REPORTS):
+                if not device.read(64):
+                    break
+        finally:
+            device.set_nonblocking(False)
+        
         samples = []
-        start_time = time.time()
+        deadline = time.monotonic() + duration
         last_data = None
         
         print(f"   Recording for {duration} seconds... ", end='', flush=True)
         
-        while time.time() - start_time < duration:
-            data = device.read(64)
-            if data and len(data) > 0:
-                data_list = list(data)
-                # Only keep unique samples
-                if data_list != last_data:
-                    samples.append(data_list)
-                    last_data = data_list
-            time.sleep(0.01)
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+            # Blocking read with the remaining time as timeout - no polling sleep
+            data = device.read(64, remaining_ms)
+            if data:
+                # Only keep unique samples - compared as raw bytes (a C-level
+                # memcmp) before any padding work is done
+                raw = bytes(data)
+                if raw == last_data:
+                    continue
+                last_data = raw
+                if len(raw) > self.report_length:
+                    self.report_length = len(raw)
+                samples.append(_pad_report(raw))
         
         print(f"Got {len(samples)} samples")
         return samples
     
     def _analyze_samples(self, baseline, hover, contact, movement, pressure, tilt_x, tilt_y, buttons) -> Dict[str, Any]:
         """Analyze samples to determine byte mappings"""
-        mappings = {}
-        
         if not hover and not contact and not movement:
             print("  ⚠ No data captured - device might be event-based")
-            return mappings
+            return {}
+        
+        key = _capture_digest(
+            self.report_length,
+            (baseline, hover, contact, movement, pressure, tilt_x, tilt_y, buttons)
+        )
+        cached = _MAPPINGS_CACHE.get(key)
+        if cached is not None:
+            print("  ✓ Capture unchanged, reusing previously detected mappings")
+            mappings = copy.deepcopy(cached)
+        else:
+            mappings = self._detect_mappings(baseline, hover, contact, movement, pressure, tilt_x, tilt_y, buttons)
+            if len(_MAPPINGS_CACHE) >= _MAPPINGS_CACHE_SIZE:
+                del _MAPPINGS_CACHE[next(iter(_MAPPINGS_CACHE))]
+            _MAPPINGS_CACHE[key] = copy.deepcopy(mappings)
+        
+        # Specialize a raw decoder for the detected layout and use it to show
+        # how the most recent contact sample decodes
+        # (best effort - a failure here must not lose the detected mappings)
+        if mappings:
+            try:
+                self._fast_parse = _compile_parser(mappings)
+                preview = contact or movement or hover
+                if preview:
+                    print(f"  ✓ Sample decode: {self._fast_parse(preview[-1])}")
+            except Exception as e:
+                self._fast_parse = None
+                print(f"  ⚠️  Could not build sample decoder: {e}")
+        
+        return mappings
+    
+    def _detect_mappings(self, baseline, hover, contact, movement, pressure, tilt_x, tilt_y, buttons) -> Dict[str, Any]:
+        """Run every byte finder over the captured samples"""
+        mappings = {}
         
         # Determine status byte and codes
         status_info = self._find_status_byte(baseline, hover, contact, buttons)
@@ -534,79 +947,48 @@ class DeviceDiscovery:
             'buttons': buttons or []
         }
         
-        # Check bytes 1-3 (most common for status)
-        max_len = max(len(s[0]) if s else 0 for s in all_samples.values())
+        # One contiguous buffer per state; byte columns are strided slices of it.
+        # The states are also joined so a byte's values across every state come
+        # from a single strided pass
+        state_buffers = {name: _sample_matrix(samples) for name, samples in all_samples.items()}
+        combined = b''.join(state_buffers.values())
         
-        for byte_idx in range(1, min(4, max_len)):
-            # Collect ALL unique values for this byte (not just most common)
-            state_values = {}
-            
-            for state_name, samples in all_samples.items():
-                values = set()
-                for s in samples:
-                    if len(s) > byte_idx:
-                        values.add(s[byte_idx])
-                if values:
-                    state_values[state_name] = values
-            
-            # Check if this byte changes between states
-            all_values = set()
-            for vals in state_values.values():
-                all_values.update(vals)
+        # Check bytes 1-3 (most common for status)
+        for byte_idx in range(1, 4):
+            # Collect ALL unique values for this byte (not just most common),
+            # as a 256-bit value mask
+            all_mask = _value_mask(combined[byte_idx::_REPORT_WIDTH])
             
             # Status byte should have multiple distinct values across states
-            if len(all_values) < 2:
+            if bin(all_mask).count('1') < 2:
                 continue
             
+            # Per-state masks are only needed once the byte is a candidate
+            state_masks = {state_name: _value_mask(buf[byte_idx::_REPORT_WIDTH])
+                           for state_name, buf in state_buffers.items() if buf}
+            
             # This looks like a status byte! Map all observed values
             # Use common patterns to identify states correctly
             values_map = {}
             
-            # Common status code patterns (used by most tablets):
-            # 192 (0xC0) = none/away
-            # 160 (0xA0) = hover
-            # 161 (0xA1) = contact
-            # 162 (0xA2) = hover + secondary button
-            # 163 (0xA3) = contact + secondary button
-            # 164 (0xA4) = hover + primary button
-            # 165 (0xA5) = contact + primary button
-            # 240 (0xF0) = tablet buttons
-            
-            # Collect all observed values
-            all_observed = set()
-            for vals in state_values.values():
-                all_observed.update(vals)
-            
             # Use pattern recognition for common codes
-            for val in all_observed:
+            for val in _mask_values(all_mask):
                 val_str = str(val)
                 
                 # Recognize common patterns
-                if val == 192:  # 0xC0
-                    values_map[val_str] = {"state": "none"}
-                elif val == 160:  # 0xA0
-                    values_map[val_str] = {"state": "hover"}
-                elif val == 162:  # 0xA2
-                    values_map[val_str] = {"state": "hover", "secondaryButtonPressed": True}
-                elif val == 164:  # 0xA4
-                    values_map[val_str] = {"state": "hover", "primaryButtonPressed": True}
-                elif val == 161:  # 0xA1
-                    values_map[val_str] = {"state": "contact"}
-                elif val == 163:  # 0xA3
-                    values_map[val_str] = {"state": "contact", "secondaryButtonPressed": True}
-                elif val == 165:  # 0xA5
-                    values_map[val_str] = {"state": "contact", "primaryButtonPressed": True}
-                elif val == 240:  # 0xF0
-                    values_map[val_str] = {"state": "buttons"}
+                known = _KNOWN_STATUS_CODES.get(val)
+                if known is not None:
+                    values_map[val_str] = dict(known)
                 else:
                     # Unknown value - try to infer from which test phase it appeared in
-                    if 'baseline' in state_values and val in state_values['baseline']:
+                    bit = 1 << val
+                    if state_masks.get('baseline', 0) & bit:
                         values_map[val_str] = {"state": "none"}
-                    elif 'hover' in state_values and val in state_values['hover']:
+                    elif state_masks.get('hover', 0) & bit:
                         values_map[val_str] = {"state": "hover"}
-                    elif 'contact' in state_values and val in state_values['contact']:
+                    elif state_masks.get('contact', 0) & bit:
                         values_map[val_str] = {"state": "contact"}
-                    elif 'buttons' in state_values and val in state_values['buttons']:
+                    elif state_masks.get('buttons', 0) & bit:
                         values_map[val_str] = {"state": "buttons"}
             
             # If we found a good mapping, return it
@@ -619,23 +1001,49 @@ class DeviceDiscovery:
         
         return None
     
-    def _find_common_byte_values(self, samples: List[List[int]]) -> Dict[int, int]:
+    def _find_common_byte_values(self, samples: List[bytes]) -> Dict[int, int]:
         """Find the most common value for each byte position"""
         if not samples:
             return {}
         
-        from collections import Counter
         byte_counts = {}
+        buf = _sample_matrix(samples)
         
-        for byte_idx in range(min(16, len(samples[0]))):
-            values = [s[byte_idx] for s in samples if len(s) > byte_idx]
-            if values:
-                counter = Counter(values)
-                byte_counts[byte_idx] = counter.most_common(1)[0][0]
+        for byte_idx in range(min(16, self.report_length)):
+            column = buf[byte_idx::_REPORT_WIDTH]
+            # bytes.count is a C scan per distinct value; ties go to the
+            # lowest value, like an argmax over a 256-slot bincount
+            byte_counts[byte_idx] = max(sorted(set(column)), key=column.count)
         
         return byte_counts
     
-    def _find_coordinates(self, movement: List[List[int]]) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _coordinate_candidate(byte_idx: int, values_16bit: Sequence[int]) -> Optional[Tuple[int, int, int]]:
+        """
+        Check whether a 16-bit column looks like a coordinate axis.
+        
+        Coordinates should:
+        1. Have significant variance (movement)
+        2. Have reasonable max values (not > 65000 which is likely noise)
+        3. Start from a reasonable minimum
+        
+        The max bounds are checked first so most non-coordinate columns are
+        rejected after a single pass, before the minimum is computed.
+        
+        Returns:
+            (byte_idx, max_val, variance) tuple, or None if rejected
+        """
+        max_val = max(values_16bit)
+        if not 1000 < max_val < 50000:
+            return None
+        
+        variance = max_val - min(values_16bit)
+        if variance <= 100:
+            return None
+        
+        return byte_idx, max_val, variance
+    
+    def _find_coordinates(self, movement: List[bytes]) -> Optional[Dict[str, Any]]:
         """Find X and Y coordinate bytes"""
         if not movement or len(movement) < 5:
             return None
@@ -644,59 +1052,26 @@ class DeviceDiscovery:
         # Typically X at bytes 2-3, Y at bytes 4-5
         candidates = []
         
+        u16_at = _u16_windows(_sample_matrix(movement))
+        
         # Check byte pairs starting at even positions (to avoid overlap)
         # Start at byte 2 (after Report ID and Status)
-        for byte_idx in range(2, min(8, len(movement[0])), 2):
-            if byte_idx + 1 >= len(movement[0]):
-                break
-            
+        for byte_idx in range(2, 8, 2):
             # Reconstruct 16-bit values (little-endian)
-            values_16bit = []
-            for s in movement:
-                if len(s) > byte_idx + 1:
-                    val = s[byte_idx] + (s[byte_idx + 1] << 8)
-                    values_16bit.append(val)
-            
-            if not values_16bit:
-                continue
-            
-            # Check if this looks like a coordinate
-            min_val = min(values_16bit)
-            max_val = max(values_16bit)
-            variance = max_val - min_val
-            
-            # Coordinates should:
-            # 1. Have significant variance (movement)
-            # 2. Have reasonable max values (not > 65000 which is likely noise)
-            # 3. Start from a reasonable minimum
-            if variance > 100 and max_val < 50000 and max_val > 1000:
-                candidates.append((byte_idx, max_val, variance))
+            candidate = self._coordinate_candidate(byte_idx, u16_at(byte_idx))
+            if candidate:
+                candidates.append(candidate)
         
         # Also check odd-positioned pairs in case device uses different layout
         if len(candidates) < 2:
-            for byte_idx in range(3, min(9, len(movement[0])), 2):
-                if byte_idx + 1 >= len(movement[0]):
-                    break
-                
+            for byte_idx in range(3, 9, 2):
                 # Skip if this would overlap with already found candidates
                 if any(abs(byte_idx - c[0]) <= 1 for c in candidates):
                     continue
                 
-                values_16bit = []
-                for s in movement:
-                    if len(s) > byte_idx + 1:
-                        val = s[byte_idx] + (s[byte_idx + 1] << 8)
-                        values_16bit.append(val)
-                
-                if not values_16bit:
-                    continue
-                
-                min_val = min(values_16bit)
-                max_val = max(values_16bit)
-                variance = max_val - min_val
-                
-                if variance > 100 and max_val < 50000 and max_val > 1000:
-                    candidates.append((byte_idx, max_val, variance))
+                candidate = self._coordinate_candidate(byte_idx, u16_at(byte_idx))
+                if candidate:
+                    candidates.append(candidate)
         
         # Need exactly 2 coordinate pairs
         if len(candidates) >= 2:
@@ -730,7 +1105,7 @@ class DeviceDiscovery:
         
         return None
     
-    def _find_pressure(self, contact: List[List[int]], pressure: List[List[int]]) -> Optional[Dict[str, Any]]:
+    def _find_pressure(self, contact: List[bytes], pressure: List[bytes]) -> Optional[Dict[str, Any]]:
         """Find pressure bytes"""
         all_samples = contact + pressure
         if not all_samples:
@@ -741,20 +1116,14 @@ class DeviceDiscovery:
         # Start at byte 6 to avoid coordinate bytes
         best_candidate = None
         best_score = 0
+        u16_at = _u16_windows(_sample_matrix(all_samples))
         
-        for byte_idx in range(6, min(10, len(all_samples[0])), 2):
-            if byte_idx + 1 >= len(all_samples[0]):
+        for byte_idx in range(6, min(10, self.report_length), 2):
+            if byte_idx + 1 >= self.report_length:
                 continue
             
             # Try 16-bit value (little-endian)
-            values = []
-            for s in all_samples:
-                if len(s) > byte_idx + 1:
-                    val = s[byte_idx] + (s[byte_idx + 1] << 8)
-                    values.append(val)
-            
-            if not values:
-                continue
+            values = u16_at(byte_idx)
             
             max_val = max(values)
             min_val = min(values)
@@ -807,26 +1176,24 @@ class DeviceDiscovery:
         
         return None
     
-    def _find_tilt(self, tilt_x: List[List[int]], tilt_y: List[List[int]]) -> Optional[Dict[str, Any]]:
+    def _find_tilt(self, tilt_x: List[bytes], tilt_y: List[bytes]) -> Optional[Dict[str, Any]]:
         """Find tilt bytes"""
         if not tilt_x and not tilt_y:
             return None
         
         mappings = {}
+        buf_x = _sample_matrix(tilt_x) if tilt_x else b''
         
         # Look for signed bytes (bytes 8-9 typically, AFTER pressure at 6-7)
         # Start at byte 8 to avoid detecting the pressure high byte (byte 7)
-        for byte_idx in range(8, min(12, len((tilt_x or tilt_y)[0]))):
+        for byte_idx in range(8, min(12, self.report_length)):
             if tilt_x:
-                values_x = [s[byte_idx] for s in tilt_x if len(s) > byte_idx]
+                values_x = buf_x[byte_idx::_REPORT_WIDTH]
                 
                 # Tilt should have both small positive values and large values (200+)
                 # This indicates bipolar range: 0-60 for positive, 196-255 for negative
-                if not values_x:
-                    continue
-                
-                has_low = any(v < 100 for v in values_x)
-                has_high = any(v > 180 for v in values_x)
+                has_low = min(values_x) < 100
+                has_high = max(values_x) > 180
                 
                 # Must have BOTH low and high values to be tilt (bipolar)
                 # Pressure would only have low values or be more uniform
@@ -840,7 +1207,7 @@ class DeviceDiscovery:
                         'type': 'bipolar-range'
                     }
                     
-                    if tilt_y and byte_idx + 1 < len(tilt_y[0]):
+                    if tilt_y and byte_idx + 1 < self.report_length:
                         mappings['tiltY'] = {
                             'byteIndex': byte_idx + 1,
                             'positiveMax': 60,
@@ -852,7 +1219,7 @@ class DeviceDiscovery:
         
         return mappings if mappings else None
     
-    def _find_buttons(self, buttons: List[List[int]]) -> Optional[Dict[str, Any]]:
+    def _find_buttons(self, buttons: List[bytes]) -> Optional[Dict[str, Any]]:
         """Find button byte"""
         if not buttons:
             return None
@@ -863,22 +1230,23 @@ class DeviceDiscovery:
         best_candidate = None
         best_score = 0
         
-        for byte_idx in range(2, min(5, len(buttons[0]))):
-            values = [s[byte_idx] for s in buttons if len(s) > byte_idx]
-            unique_values = set(values)
+        buf = _sample_matrix(buttons)
+        
+        for byte_idx in range(2, min(5, self.report_length)):
+            # Distinct values in this column, straight from a strided slice
+            unique_values = set(buf[byte_idx::_REPORT_WIDTH])
             
             # Button byte should have multiple different values
-            nonzero = [v for v in unique_values if v != 0]
+            unique_values.discard(0)
             
-            if len(nonzero) < 2:
+            if len(unique_values) < 2:
                 continue
             
             # Score based on how many values are powers of 2 (typical for bit flags)
-            powers_of_2 = [1, 2, 4, 8, 16, 32, 64, 128]
-            power_of_2_count = sum(1 for v in nonzero if v in powers_of_2)
+            power_of_2_count = len(unique_values & _BIT_FLAGS)
             
             # Also check for combinations (multiple buttons pressed)
-            combo_count = sum(1 for v in nonzero if v not in powers_of_2)
+            combo_count = len(unique_values) - power_of_2_count
             
             # Score: prefer bytes with both single buttons and combinations
             score = power_of_2_count * 2 + combo_count
@@ -916,10 +1284,10 @@ class DeviceDiscovery:
         interface_nums = [d.get('interface_number', -1) for d in self.interfaces]
         
         # Get most common report ID
-        all_report_ids = []
+        report_id_counts = Counter()
         for ids in self.report_ids.values():
-            all_report_ids.extend(ids)
-        report_id = max(set(all_report_ids), key=all_report_ids.count) if all_report_ids else 2
+            report_id_counts.update(ids)
+        report_id = report_id_counts.most_common(1)[0][0] if report_id_counts else 2
         
         # Build config
         vid = self.device_info['vendor_id']
@@ -1062,6 +1430,7 @@ class DeviceDiscovery:
                 json.dump(self.driver_config, f, indent=2)
             
             print(f"\n✓ Driver saved to: {save_path}")
+            self._remember_discovered()
             print("\nNext steps:")
             if self.byte_mappings:
                 print("  1. Review the auto-detected mappings in the JSON file")
@@ -6,8 +6,15 @@ Simple script to test Jack MIDI output from strumboli
 import jack
 import time
 import signal
+import struct
 import sys
 
+# Status byte plus two data bytes (Note On/Off, Pitch Bend)
+_MSG3 = struct.Struct('3B')
+
+# Pitch class names indexed by note % 12
+_NOTE_NAMES = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+
 print("🎵 Jack MIDI Monitor")
 print("=" * 50)
 
@@ -22,31 +29,25 @@ try:
     @client.set_process_callback
     def process(frames):
         for offset, data in midi_in.incoming_midi_events():
-            if len(data) >= 1:
-                # Convert bytes to int if needed
-                status = data[0] if isinstance(data[0], int) else ord(data[0])
+            # Jack delivers events as bytes-like buffers; only 3-byte messages are shown
+            if len(data) >= 3:
+                status, note, velocity = _MSG3.unpack_from(data)
                 timestamp = time.strftime("%H:%M:%S")
+                cmd = status & 0xF0
+                channel = (status & 0x0F) + 1
                 
-                # Parse MIDI message
-                if len(data) >= 3:
-                    cmd = status & 0xF0
-                    channel = (status & 0x0F) + 1
-                    note = data[1] if isinstance(data[1], int) else ord(data[1])
-                    velocity = data[2] if isinstance(data[2], int) else ord(data[2])
-                    
-                    if cmd == 0x90:  # Note On
-                        note_name = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B'][note % 12]
-                        octave = (note // 12) - 1
-                        print(f"[{timestamp}] 🎵 Note ON:  Ch {channel:2d} | {note_name:2s}{octave} (MIDI {note:3d}) | Vel {velocity:3d}")
-                    elif cmd == 0x80:  # Note Off
-                        note_name = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B'][note % 12]
-                        octave = (note // 12) - 1
-                        print(f"[{timestamp}] 🔇 Note OFF: Ch {channel:2d} | {note_name:2s}{octave} (MIDI {note:3d})")
-                    elif cmd == 0xE0:  # Pitch Bend
-                        lsb = data[1]
-                        msb = data[2]
-                        bend_value = (msb << 7) | lsb
-                        print(f"[{timestamp}] 🎚️  Pitch Bend: Ch {channel:2d} | Value {bend_value}")
+                if cmd == 0x90:  # Note On
+                    note_name = _NOTE_NAMES[note % 12]
+                    octave = (note // 12) - 1
+                    print(f"[{timestamp}] 🎵 Note ON:  Ch {channel:2d} | {note_name:2s}{octave} (MIDI {note:3d}) | Vel {velocity:3d}")
+                elif cmd == 0x80:  # Note Off
+                    note_name = _NOTE_NAMES[note % 12]
+                    octave = (note // 12) - 1
+                    print(f"[{timestamp}] 🔇 Note OFF: Ch {channel:2d} | {note_name:2s}{octave} (MIDI {note:3d})")
+                elif cmd == 0xE0:  # Pitch Bend
+                    # Data bytes are LSB then MSB
+                    bend_value = (velocity << 7) | note
+                    print(f"[{timestamp}] 🎚️  Pitch Bend: Ch {channel:2d} | Value {bend_value}")
     
     # Activate the client (AFTER setting callback)
     client.activate()
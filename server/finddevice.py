@@ -1,7 +1,7 @@
 import sys
 import time
 import threading
-from typing import Dict, Optional, Any, List, Tuple, Callable
+from typing import Dict, Optional, Any, List, Tuple, Callable, Iterable
 
 import hid
 
@@ -61,6 +61,155 @@ def _device_matches_filter(device_info: Dict[str, Any], filter_values: Dict[str,
     return True
 
 
+# How long a hid.enumerate() result may be reused by startup and the hotplug monitor
+ENUMERATION_CACHE_SECONDS = 2.0
+
+_enumeration_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+
+def _enumerate_devices(max_age: float = ENUMERATION_CACHE_SECONDS) -> List[Dict[str, Any]]:
+    """
+    Enumerate HID devices, reusing a recent scan if one is available.
+    
+    Startup auto-detects the driver, opens the interfaces and registers the
+    device with the hotplug monitor back to back; sharing one USB scan
+    between them avoids enumerating the bus three times in a row.
+    
+    Args:
+        max_age: Maximum age (seconds) of a cached scan to reuse; 0 forces a rescan
+        
+    Returns:
+        List of HID device info dicts
+    """
+    global _enumeration_cache
+    now = time.monotonic()
+    if max_age > 0 and _enumeration_cache is not None:
+        scanned_at, devices = _enumeration_cache
+        if now - scanned_at <= max_age:
+            return devices
+    devices = hid.enumerate()
+    _enumeration_cache = (now, devices)
+    return devices
+
+
+# hid.enumerate() fields holding ints; every other field is compared as a string
+_INT_DEVICE_FIELDS = frozenset((
+    'vendor_id', 'product_id', 'release_number', 'interface_number', 'usage_page', 'usage'
+))
+
+# Normalized filter value for a filter _device_matches_filter can never satisfy
+# (e.g. a malformed hex string); equal to nothing a device can produce
+_NO_MATCH = object()
+
+
+def _normalize_filter_value(device_key: str, filter_value: Any) -> Any:
+    """
+    Normalize a filter value so it compares equal to _normalize_device_value()
+    exactly when _device_matches_filter would accept the pair.
+    
+    Args:
+        device_key: HID device info key the filter applies to (already normalized)
+        filter_value: Value from the driver's deviceInfo
+    """
+    if isinstance(filter_value, str) and filter_value.startswith('0x'):
+        # Hex strings only ever match integer device values
+        if device_key not in _INT_DEVICE_FIELDS:
+            return _NO_MATCH
+        try:
+            return int(filter_value, 16)
+        except ValueError:
+            return _NO_MATCH
+    
+    if device_key not in _INT_DEVICE_FIELDS:
+        return str(filter_value)
+    
+    if isinstance(filter_value, int):
+        return filter_value
+    if isinstance(filter_value, str) and filter_value.isdigit():
+        return int(filter_value)
+    # Anything else falls back to comparing str() forms, which for an int device
+    # value only succeeds if the string is that int's canonical form (e.g. "-1")
+    text = str(filter_value)
+    try:
+        value = int(text)
+    except ValueError:
+        return text
+    return value if str(value) == text else text
+
+
+def _normalize_device_value(device_key: str, device_value: Any) -> Any:
+    """Normalize an enumerated device value for comparison with a filter key."""
+    if device_key in _INT_DEVICE_FIELDS and isinstance(device_value, int):
+        return device_value
+    return str(device_value)
+
+
+def _filter_signature(device_filter: Dict[str, Any]) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
+    """
+    Split a deviceInfo filter into its (device keys, normalized values) identity.
+    
+    Two filters with the same key tuple can be told apart with a single hash
+    lookup on the value tuple.
+    """
+    normalized = ((_normalize_filter_key(k), v) for k, v in device_filter.items() if k != 'interfaces')
+    items = sorted(((k, _normalize_filter_value(k, v)) for k, v in normalized), key=lambda item: item[0])
+    return tuple(k for k, _ in items), tuple(v for _, v in items)
+
+
+def _device_key(device_info: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[Tuple[Any, ...]]:
+    """Build the identity tuple of a device for the given keys (None if a key is missing)."""
+    try:
+        return tuple(_normalize_device_value(k, device_info[k]) for k in keys)
+    except KeyError:
+        return None
+
+
+def build_driver_index(driver_profiles: Iterable[Tuple[str, Dict[str, Any]]]
+                       ) -> Dict[Tuple[str, ...], Dict[Tuple[Any, ...], Tuple[str, Dict[str, Any]]]]:
+    """
+    Index driver profiles by their deviceInfo identity.
+    
+    Profiles are grouped by the set of keys their filter uses (e.g.
+    product_string + usage); within a group the normalized values map
+    straight to the profile. When two profiles share an identity the first
+    one wins, matching the order a linear scan would have used.
+    
+    Args:
+        driver_profiles: Iterable of (driver_name, driver_config) tuples
+        
+    Returns:
+        Dict of key tuple -> {value tuple: (driver_name, driver_config)}
+    """
+    index: Dict[Tuple[str, ...], Dict[Tuple[Any, ...], Tuple[str, Dict[str, Any]]]] = {}
+    for driver_name, driver_config in driver_profiles:
+        if not driver_config or 'deviceInfo' not in driver_config:
+            continue
+        keys, values = _filter_signature(driver_config['deviceInfo'])
+        index.setdefault(keys, {}).setdefault(values, (driver_name, driver_config))
+    return index
+
+
+def lookup_driver(index: Dict[Tuple[str, ...], Dict[Tuple[Any, ...], Tuple[str, Dict[str, Any]]]],
+                  device_info: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Find the driver profile matching an enumerated device.
+    
+    Args:
+        index: Index built by build_driver_index()
+        device_info: HID device information
+        
+    Returns:
+        (driver_name, driver_config) tuple, or None if no profile matches
+    """
+    for keys, profiles in index.items():
+        device_key = _device_key(device_info, keys)
+        if device_key is not None:
+            match = profiles.get(device_key)
+            if match is not None:
+                return match
+    return None
+
+
 def find_and_open_device(tablet_config: Dict[str, Any]) -> Optional[Any]:
     """
     Find and open a tablet device based on config.
@@ -117,7 +266,7 @@ def find_and_open_all_interfaces(tablet_config: Dict[str, Any]) -> list:
     
     # Get all devices matching filter (without interface requirement)
     try:
-        devices = hid.enumerate()
+        devices = _enumerate_devices()
         matching_devices = []
         
         for device_info in devices:
@@ -165,49 +314,62 @@ def find_and_open_all_interfaces(tablet_config: Dict[str, Any]) -> list:
         return []
 
 
-def auto_detect_device(driver_profiles: List[Tuple[str, Dict[str, Any]]]) -> Optional[str]:
+def auto_detect_device(driver_loaders: Iterable[Tuple[str, Callable[[], Optional[Dict[str, Any]]]]]) -> Optional[str]:
     """
     Auto-detect which driver profile matches a connected HID device.
     
+    Drivers are loaded one at a time, so profiles after the first match are
+    never parsed. Each driver is checked with a set lookup against the
+    connected devices' identity tuples, which are built once per distinct
+    set of filter keys rather than once per driver.
+    
     Args:
-        driver_profiles: List of (driver_name, driver_config) tuples
+        driver_loaders: Iterable of (driver_name, loader) tuples, where loader()
+                        returns the driver config (or None if it failed to load)
         
     Returns:
         Driver name if a match is found, None otherwise
     """
-    if not driver_profiles:
-        print("[FindDevice] No driver profiles provided for auto-detection")
-        return None
-    
     print(f"[FindDevice] Auto-detecting device...")
     
     # Get all connected HID devices
     try:
-        devices = hid.enumerate()
+        devices = _enumerate_devices()
         print(f"[FindDevice] Found {len(devices)} HID devices")
     except Exception as e:
         print(f"[FindDevice] Error enumerating HID devices: {e}")
         return None
     
-    print(f"[FindDevice] Checking against {len(driver_profiles)} driver profiles...")
+    checked = 0
+    # Identity tuples of the connected devices, keyed by the filter keys used
+    device_keys: Dict[Tuple[str, ...], set] = {}
     
-    # Try to match each device against each driver
-    for device_info in devices:
-        for driver_name, driver_config in driver_profiles:
-            # Get deviceInfo filter from driver config
-            if 'deviceInfo' not in driver_config:
-                continue
-            
-            # Remove 'interfaces' from filter since enumeration only has 'interface_number'
-            device_filter = {k: v for k, v in driver_config['deviceInfo'].items() 
-                           if k != 'interfaces'}
-            
-            if _device_matches_filter(device_info, device_filter):
-                device_name = driver_config.get('name', driver_name)
-                print(f"[FindDevice] ✓ Auto-detected: {device_name} (driver: {driver_name})")
-                return driver_name
+    for driver_name, load_driver in driver_loaders:
+        driver_config = load_driver()
+        checked += 1
+        
+        # Get deviceInfo filter from driver config
+        if not driver_config or 'deviceInfo' not in driver_config:
+            continue
+        
+        # 'interfaces' is dropped from the signature since enumeration only has 'interface_number'
+        keys, values = _filter_signature(driver_config['deviceInfo'])
+        connected = device_keys.get(keys)
+        if connected is None:
+            connected = {_device_key(d, keys) for d in devices}
+            connected.discard(None)
+            device_keys[keys] = connected
+        
+        if values in connected:
+            device_name = driver_config.get('name', driver_name)
+            print(f"[FindDevice] ✓ Auto-detected: {device_name} (driver: {driver_name})")
+            return driver_name
     
-    print("[FindDevice] No matching driver profile found for connected devices")
+    if not checked:
+        print("[FindDevice] No driver profiles provided for auto-detection")
+        return None
+    
+    print(f"[FindDevice] No matching driver profile found among {checked} driver profiles")
     return None
 
 def get_tablet_device(filter_values: Dict[str, str]) -> Optional[Any]:
@@ -309,6 +471,7 @@ class HotplugMonitor:
             check_interval: How often to check for new devices (seconds)
         """
         self.driver_profiles = driver_profiles
+        self._driver_index = build_driver_index(driver_profiles)
         self.on_device_connected = on_device_connected
         self.on_device_disconnected = on_device_disconnected
         self.check_interval = check_interval
@@ -349,7 +512,7 @@ class HotplugMonitor:
             tablet_config: The tablet configuration with device info
         """
         try:
-            devices = hid.enumerate()
+            devices = _enumerate_devices()
             device_filter = {k: v for k, v in tablet_config.items() 
                            if k not in ['byteCodeMappings', '_driverName', '_driverInfo', 'reportId', 'interfaces']}
             
@@ -374,9 +537,9 @@ class HotplugMonitor:
     
     def _monitor_loop(self):
         """Main monitoring loop running in background thread."""
-        # Initial scan to populate known devices
+        # Initial scan to populate known devices (usually the scan startup just made)
         try:
-            devices = hid.enumerate()
+            devices = _enumerate_devices()
             for device_info in devices:
                 device_id = self._get_device_id(device_info)
                 self._known_devices.add(device_id)
@@ -385,8 +548,9 @@ class HotplugMonitor:
         
         while self._running:
             try:
-                # Check for new devices
-                current_devices = hid.enumerate()
+                # Check for new devices. Polls are check_interval apart, so this
+                # rescans unless another caller just did, and refreshes the shared cache
+                current_devices = _enumerate_devices()
                 current_device_ids = set()
                 
                 for device_info in current_devices:
@@ -396,34 +560,27 @@ class HotplugMonitor:
                     # Check if this is a newly connected device
                     if device_id not in self._known_devices:
                         # Check if it matches any driver profile
-                        for driver_name, driver_config in self.driver_profiles:
-                            if 'deviceInfo' not in driver_config:
-                                continue
+                        match = lookup_driver(self._driver_index, device_info)
+                        if match is not None:
+                            driver_name, driver_config = match
+                            device_name = driver_config.get('name', driver_name)
+                            print(f"[Hotplug] New device detected: {device_name}")
                             
-                            # Remove 'interfaces' from filter since enumeration only has 'interface_number'
-                            device_filter = {k: v for k, v in driver_config['deviceInfo'].items() 
-                                           if k != 'interfaces'}
-                            
-                            if _device_matches_filter(device_info, device_filter):
-                                device_name = driver_config.get('name', driver_name)
-                                print(f"[Hotplug] New device detected: {device_name}")
+                            # Try to open the device
+                            try:
+                                device = hid.device()
+                                if 'path' in device_info and device_info['path']:
+                                    device.open_path(device_info['path'])
+                                else:
+                                    device.open(device_info['vendor_id'], device_info['product_id'])
+                                
+                                # Notify callback
+                                self.on_device_connected(driver_name, driver_config, device)
+                                # Track this device as the connected one
+                                self._connected_device_id = device_id
                                 
-                                # Try to open the device
-                                try:
-                                    device = hid.device()
-                                    if 'path' in device_info and device_info['path']:
-                                        device.open_path(device_info['path'])
-                                    else:
-                                        device.open(device_info['vendor_id'], device_info['product_id'])
-                                    
-                                    # Notify callback
-                                    self.on_device_connected(driver_name, driver_config, device)
-                                    # Track this device as the connected one
-                                    self._connected_device_id = device_id
-                                    break  # Stop checking other profiles for this device
-                                    
-                                except Exception as e:
-                                    print(f"[Hotplug] Error opening device: {e}")
+                            except Exception as e:
+                                print(f"[Hotplug] Error opening device: {e}")
                 
                 # Check if the connected device was disconnected
                 if self._connected_device_id and self._connected_device_id not in current_device_ids:
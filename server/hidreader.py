@@ -5,16 +5,43 @@ Handles reading data from HID devices (e.g., graphics tablets)
 and processing the raw data according to configuration byte code mappings.
 """
 
+import sys
 import time
 import struct
-from typing import Dict, Any, Union, Callable, Optional, TYPE_CHECKING
+import logging
+from typing import Dict, Any, Union, Callable, Optional, Sequence, TYPE_CHECKING
 
-from datahelpers import parse_code, parse_range_data, parse_bipolar_range_data, parse_multi_byte_range_data, parse_bit_flags
+from config import MappingType
+from datahelpers import parse_range_data, parse_bipolar_range_data, parse_multi_byte_range_data
 
 if TYPE_CHECKING:
     from config import Config
 
 
+# Reader diagnostics go through logging so messages are only formatted when emitted
+log = logging.getLogger(__name__)
+
+# Stylus position keys, which are not decoded on the button interface or in button mode
+_POSITION_KEYS = frozenset(('x', 'y', 'pressure', 'tiltX', 'tiltY'))
+
+# Little-endian unpackers for multi-byte-range values spanning 1, 2 or 4 consecutive bytes
+_UNPACKERS = {
+    1: struct.Struct('<B').unpack_from,
+    2: struct.Struct('<H').unpack_from,
+    4: struct.Struct('<I').unpack_from,
+}
+
+# Identical consecutive reports (a stationary stylus) are dropped, but one is still
+# delivered at least this often (seconds) so time-driven handlers such as the
+# note repeater keep ticking while the pen is held perfectly still
+_DUPLICATE_REPORT_INTERVAL = 0.02
+
+
+def _button_keys(button_count: int) -> tuple:
+    """Interned 'button1'..'buttonN' result keys, built once per compiled mapping."""
+    return tuple(sys.intern(f'button{i}') for i in range(1, button_count + 1))
+
+
 class HIDReader:
     """Manages HID device reading and data processing"""
     
@@ -37,191 +64,258 @@ class HIDReader:
         # Use reportId from config, default to 2 if not specified
         self.expected_report_id = getattr(config, 'report_id', 2)
         self.wrong_report_id_warned = False  # Only warn once
+        self._compile_mappings()
+    
+    def _compile_mappings(self) -> None:
+        """
+        Split the config's compiled byte code mappings into per-type decode plans.
+        
+        Each plan is a tuple of flat entry tuples with every mapping field
+        already extracted, so the per-packet path dispatches by list rather
+        than by comparing type strings and never calls dict.get(). Two value
+        plans are kept: the full one for stylus packets and one without the
+        position keys for button packets. The plans are rebuilt only when the
+        config's compiled mappings are replaced.
+        """
+        source = self.config.compiled_mappings
+        self._status_entry = self.config.status_mapping
+        self._button_code_entry = None
+        range_entries = []
+        mbrange_entries = []
+        mbrange_fallback_entries = []
+        bipolar_entries = []
+        bitflags_entries = []
         
-    def process_device_data(self, data: bytes) -> Dict[str, Union[str, int, float]]:
+        for row in source:
+            if row.type is MappingType.CODE:
+                # Only tabletButtons codes are decoded here; other codes are status
+                if row.key == 'tabletButtons' and isinstance(row.values, dict):
+                    # 256-entry byte value -> pressed button number (0 = none)
+                    button_lut = tuple(
+                        (value.get('button') or 0) if isinstance(value, dict) else 0
+                        for value in row.values_lut
+                    )
+                    self._button_code_entry = (row.byte_index, button_lut, _button_keys(row.button_count))
+            elif row.type is MappingType.RANGE:
+                range_entries.append((row.key, row.byte_index, row.min, row.max))
+            elif row.type is MappingType.MULTI_BYTE_RANGE:
+                indices = row.byte_indices
+                unpack = _UNPACKERS.get(len(indices))
+                if unpack is not None and indices == tuple(range(indices[0], indices[0] + len(indices))):
+                    # Consecutive low-to-high bytes decode with a single struct unpack
+                    mbrange_entries.append((
+                        row.key, unpack, indices[0], indices[-1], row.min, row.max - row.min
+                    ))
+                else:
+                    mbrange_fallback_entries.append((row.key, indices, row.min, row.max))
+            elif row.type is MappingType.BIPOLAR_RANGE:
+                bipolar_entries.append((
+                    row.key, row.byte_index,
+                    row.positive_min, row.positive_max, row.negative_min, row.negative_max
+                ))
+            elif row.type is MappingType.BIT_FLAGS:
+                # Bit flags are only decoded for button packets, which never carry position keys
+                if row.key not in _POSITION_KEYS:
+                    bitflags_entries.append((
+                        row.byte_index,
+                        _button_keys(row.button_count),
+                        tuple(1 << i for i in range(row.button_count))
+                    ))
+        
+        plan = (range_entries, mbrange_entries, mbrange_fallback_entries, bipolar_entries)
+        self._stylus_plan = tuple(tuple(entries) for entries in plan)
+        self._button_plan = tuple(
+            tuple(entry for entry in entries if entry[0] not in _POSITION_KEYS)
+            for entries in plan
+        )
+        self._bitflags_entries = tuple(bitflags_entries)
+        # The struct unpackers need a bytes-like report, not hidapi's list of ints
+        self._needs_buffer = bool(mbrange_entries)
+        self._plan_source = source
+    
+    def process_device_data(self, data: Sequence[int]) -> Dict[str, Union[str, int, float]]:
         """
         Process raw device data according to configuration byte code mappings
         
         Args:
-            data: Raw bytes from HID device
+            data: Raw report from HID device (bytes or the list of ints hidapi returns)
             
         Returns:
             Dictionary with processed data values
         """
-        # Convert bytes to list of integers
-        data_list = list(data)
-
+        if self.config.compiled_mappings is not self._plan_source:
+            self._compile_mappings()
+        if self._needs_buffer and type(data) is list:
+            data = bytes(data)
+        
+        data_len = len(data)
         result: Dict[str, Union[str, int, float]] = {}
         
+        # Status is decoded first, in the same pass: the device state it reports
+        # selects which plan decodes the rest of the report
+        device_state = None
+        status = self._status_entry
+        if status is not None and status.byte_index < data_len:
+            # Index the precompiled 256-entry table directly by the status byte
+            code_result = status.values_lut[data[status.byte_index]]
+            if isinstance(code_result, dict):
+                result.update(code_result)
+                device_state = code_result.get('state')
+            else:
+                result[status.key] = code_result
+        
         # Check Report ID - some interfaces (like button interface) don't use status codes
-        report_id = data_list[0] if len(data_list) > 0 else 0
-        is_button_interface = (report_id == 6)  # Report ID 6 is button-only interface on Linux
+        # Report ID 6 is button-only interface on Linux
+        if data_len and data[0] == 6:
+            self._process_button_packet(data, data_len, result)
+        elif device_state == 'buttons':
+            # Button mode: skip coordinate/pressure/tilt and parse the button flags
+            self._decode_values(data, data_len, result, self._button_plan)
+            self._decode_bit_flags(data, data_len, result)
+        else:
+            self._decode_values(data, data_len, result, self._stylus_plan)
+        return result
+    
+    def _process_button_packet(self, data: bytes, data_len: int, result: Dict[str, Any]) -> None:
+        """Decode the rest of a report from the button-only interface (no stylus position)."""
+        # Handle tabletButtons with code type (custom value mapping)
+        # ONLY process button codes from the button interface (Report ID 6)
+        # This prevents false button detections from stylus coordinate data
+        button_code = self._button_code_entry
+        if button_code is not None:
+            byte_index, button_lut, button_keys = button_code
+            if byte_index < data_len:
+                button_num = button_lut[data[byte_index]]
+                if button_num:
+                    # Set only this button as pressed
+                    for i, button_key in enumerate(button_keys, 1):
+                        result[button_key] = (i == button_num)
         
-        # First, parse the status to determine device state (if using single-interface mode)
-        device_state = None
-        for key, mapping in self.config.mappings.items():
-            if mapping.get('type') == 'code':
-                byte_index = mapping.get('byteIndex', 0)
-                if byte_index < len(data_list):
-                    code_result = parse_code(data_list, byte_index, mapping.get('values', []))
-                    if isinstance(code_result, dict):
-                        result.update(code_result)
-                        device_state = code_result.get('state')
-                    else:
-                        result[key] = code_result
-                    break
+        self._decode_values(data, data_len, result, self._button_plan)
+        self._decode_bit_flags(data, data_len, result)
+    
+    @staticmethod
+    def _decode_values(data: bytes, data_len: int, result: Dict[str, Any], plan: tuple) -> None:
+        """Decode the range, multi-byte-range and bipolar-range entries of a plan into result."""
+        range_entries, mbrange_entries, mbrange_fallback_entries, bipolar_entries = plan
         
-        # Process remaining mappings based on device state
-        for key, mapping in self.config.mappings.items():
-            mapping_type = mapping.get('type')
-            byte_index = mapping.get('byteIndex', 0)
-            
-            # Skip if already processed (status/code), unless it's tabletButtons with code type
-            if mapping_type == 'code' and key != 'tabletButtons':
-                continue
-            
-            # Handle tabletButtons with code type (custom value mapping)
-            if key == 'tabletButtons' and mapping_type == 'code':
-                # ONLY process button codes from the button interface (Report ID 6)
-                # This prevents false button detections from stylus coordinate data
-                if is_button_interface:
-                    if byte_index < len(data_list):
-                        byte_value = str(data_list[byte_index])
-                        values_map = mapping.get('values', {})
-                        if byte_value in values_map:
-                            button_num = values_map[byte_value].get('button')
-                            if button_num:
-                                # Set only this button as pressed
-                                button_count = mapping.get('buttonCount', 8)
-                                for i in range(1, button_count + 1):
-                                    result[f'button{i}'] = (i == button_num)
-                continue
-            
-            # Skip keyboard-events type - these are handled by keyboard listener, not HID
-            if key == 'tabletButtons' and mapping_type == 'keyboard-events':
-                continue
-            
-            # Skip button parsing if not in button mode (unless we're on button-only interface)
-            if mapping_type == 'bit-flags' and device_state != 'buttons' and not is_button_interface:
-                continue
-            
-            # Skip coordinate/pressure/tilt parsing if on button-only interface or in button mode
-            if (is_button_interface or device_state == 'buttons') and key in ['x', 'y', 'pressure', 'tiltX', 'tiltY']:
-                continue
-            
-            # Skip validation for multi-byte-range as it uses byteIndices instead
-            if mapping_type != 'multi-byte-range' and byte_index >= len(data_list):
-                continue
-                
-            if mapping_type == 'range':
-                result[key] = parse_range_data(
-                    data_list, 
-                    byte_index, 
-                    mapping.get('min', 0), 
-                    mapping.get('max', 0)
+        for key, byte_index, min_val, max_val in range_entries:
+            if byte_index < data_len:
+                result[key] = parse_range_data(data, byte_index, min_val, max_val)
+        
+        for key, unpack, offset, last_index, min_val, span in mbrange_entries:
+            if last_index < data_len:
+                result[key] = (unpack(data, offset)[0] - min_val) / span if span else 0.0
+        
+        for key, byte_indices, min_val, max_val in mbrange_fallback_entries:
+            # Validate all indices are within bounds
+            if all(idx < data_len for idx in byte_indices):
+                result[key] = parse_multi_byte_range_data(
+                    data,
+                    byte_indices,
+                    min_val,
+                    max_val,
+                    debug_name=key  # Pass the key name for debug logging
                 )
-            elif mapping_type == 'multi-byte-range':
-                byte_indices = mapping.get('byteIndices', [])
-                # Validate all indices are within bounds
-                if all(idx < len(data_list) for idx in byte_indices):
-                    result[key] = parse_multi_byte_range_data(
-                        data_list,
-                        byte_indices,
-                        mapping.get('min', 0),
-                        mapping.get('max', 0),
-                        debug_name=key  # Pass the key name for debug logging
-                    )
-            elif mapping_type == 'bipolar-range':
+        
+        for key, byte_index, pos_min, pos_max, neg_min, neg_max in bipolar_entries:
+            if byte_index < data_len:
                 result[key] = parse_bipolar_range_data(
-                    data_list,
-                    byte_index,
-                    mapping.get('positiveMin', 0),
-                    mapping.get('positiveMax', 0),
-                    mapping.get('negativeMin', 0),
-                    mapping.get('negativeMax', 0)
-                )
-            elif mapping_type == 'bit-flags':
-                button_states = parse_bit_flags(
-                    data_list,
-                    byte_index,
-                    mapping.get('buttonCount', 8)
+                    data, byte_index, pos_min, pos_max, neg_min, neg_max
                 )
-                result.update(button_states)
-        
-        return result
     
-    def start_reading(self, buffer_size: int = 64, sleep_interval: float = 0.001):
+    def _decode_bit_flags(self, data: bytes, data_len: int, result: Dict[str, Any]) -> None:
+        """Decode bit-flags button bytes into result."""
+        for byte_index, button_keys, masks in self._bitflags_entries:
+            if byte_index < data_len:
+                # Check if bit i is set (button is pressed)
+                flags = data[byte_index]
+                result.update(zip(button_keys, [bool(flags & mask) for mask in masks]))
+    
+    def start_reading(self, buffer_size: int = 64, timeout_ms: int = 50):
         """
         Start reading from the HID device in a loop
         
+        Reads block in the OS until a report arrives or the timeout expires,
+        so an idle tablet costs no CPU and reports are handled as soon as
+        they are delivered. Run this on a dedicated thread.
+        
         Args:
             buffer_size: Size of read buffer in bytes
-            sleep_interval: Sleep time between reads when no data (seconds)
+            timeout_ms: Read timeout (milliseconds); bounds how long stop() takes to be noticed
         """
         if not self.device:
             raise ValueError("No device available for reading")
         
         self.is_running = True
         
-        # Use non-blocking mode to allow signal handling
-        self.device.set_nonblocking(True)
-        read_count = 0
-        empty_read_count = 0
+        # Blocking reads with a short timeout so is_running is re-checked promptly
+        self.device.set_nonblocking(False)
+        last_report = None
+        last_delivered = 0.0
+        
+        # Bind per-report attribute lookups to locals once
+        read = self.device.read
+        process = self.process_device_data
+        callback = self.data_callback
+        monotonic = time.monotonic
 
-        print("[HID] Starting device reading loop...")
+        log.info("[HID] Starting device reading loop...")
 
         while self.is_running:
             try:
-                # Read data from device (non-blocking)
-                data = self.device.read(buffer_size)
-                read_count += 1
+                # Read data from device (blocks until a report arrives or the timeout expires)
+                data = read(buffer_size, timeout_ms)
 
                 if data:
-                    empty_read_count = 0  # Reset empty count
-                    
                     # Log Report ID for debugging (different interfaces may use different IDs)
                     # On multi-interface devices, buttons and stylus may have different report IDs
-                    report_id = data[0] if len(data) > 0 else 0
-                    if len(data) > 0 and not self.wrong_report_id_warned:
-                        if report_id != self.expected_report_id:
-                            print(f"[HID] Note: Interface using Report ID {report_id} (config specifies {self.expected_report_id})")
-                            self.wrong_report_id_warned = True
+                    # The warned flag is checked first so the comparison stops once it has been logged
+                    if not self.wrong_report_id_warned and data[0] != self.expected_report_id:
+                        log.info("[HID] Note: Interface using Report ID %s (config specifies %s)", data[0], self.expected_report_id)
+                        self.wrong_report_id_warned = True
+                    
+                    # Skip reports identical to the previous one (nothing moved).
+                    # hidapi returns a fresh list per read, so it can be kept and
+                    # compared as-is without copying
+                    now = monotonic()
+                    if data == last_report and now - last_delivered < _DUPLICATE_REPORT_INTERVAL:
+                        continue
+                    last_report = data
+                    last_delivered = now
                     
                     # Process the data
-                    processed_data = self.process_device_data(bytes(data))
+                    processed_data = process(data)
                     
                     # Call the callback with processed data
-                    if self.data_callback:
-                        self.data_callback(processed_data)
-                else:
-                    empty_read_count += 1
-                    # Small sleep to prevent CPU spinning
-                    time.sleep(sleep_interval)
+                    if callback:
+                        callback(processed_data)
 
             except OSError as e:
                 # Handle device disconnection
-                if "read error" in str(e).lower() or "device" in str(e).lower():
-                    print(f"[HID] Device disconnected or error: {e}")
+                message = str(e).lower()
+                if "read error" in message or "device" in message:
+                    log.warning("[HID] Device disconnected or error: %s", e)
                     self.is_running = False
                     break
-                print(f"[HID] Error reading from device: {e}")
+                log.warning("[HID] Error reading from device: %s", e)
                 time.sleep(0.1)
             except Exception as e:
-                print(f"[HID] Unexpected error: {e}")
+                log.warning("[HID] Unexpected error: %s", e)
                 time.sleep(0.1)
         
-        print("[HID] Device reading loop stopped")
+        log.info("[HID] Device reading loop stopped")
     
     def stop(self):
         """Stop the reading loop"""
-        print("[HID] Stopping HID reader...")
+        log.info("[HID] Stopping HID reader...")
         self.is_running = False
     
     def close(self):
         """Close the HID device"""
         if self.device:
             try:
-                print("[HID] Closing HID device...")
+                log.info("[HID] Closing HID device...")
                 # Try to ensure the device is in a good state before closing
                 try:
                     self.device.set_nonblocking(False)
@@ -229,16 +323,16 @@ class HIDReader:
                     pass  # Ignore if this fails
                 
                 self.device.close()
-                print("[HID] HID device closed successfully")
+                log.info("[HID] HID device closed successfully")
                 self.device = None
                 
                 # Give the OS more time to fully release the device handle
                 # This is crucial for HID devices on macOS
-                print("[HID] Waiting for OS to release device handle...")
+                log.info("[HID] Waiting for OS to release device handle...")
                 time.sleep(0.5)
-                print("[HID] Device should be released now")
+                log.info("[HID] Device should be released now")
                 
             except Exception as e:
-                print(f"[HID] Error closing device: {e}")
+                log.warning("[HID] Error closing device: %s", e)
                 self.device = None  # Clear reference even if close failed
 
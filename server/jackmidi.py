@@ -1,7 +1,14 @@
 import time
+import collections
+import bisect
+import functools
+import heapq
+import itertools
+import os
+import struct
 import threading
-import queue
-from typing import List, Optional, Tuple
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence, Tuple
 try:
     import jack
 except ImportError:
@@ -9,7 +16,57 @@ except ImportError:
 from note import Note, NoteObject
 from midievent import MidiConnectionEvent, MidiNoteEvent, NOTE_EVENT, CONNECTION_EVENT
 from eventlistener import EventEmitter
+try:
+    from config import Config
+except ImportError:
+    Config = None
+
+
+# Fixed 8-byte ring buffer record for MIDI in either direction:
+# frame offset (uint32), message length (uint8), up to 3 message bytes
+_MIDI_RECORD = struct.Struct('<IB3s')
+_MIDI_RECORD_SIZE = _MIDI_RECORD.size
+
+# The same record packed straight from a 3-byte message's ints (no bytes object needed)
+_SHORT_MESSAGE_RECORD = struct.Struct('<I4B')
+
+# Sixteen short-message records back to back (one per channel) for omni fan-out,
+# and the pack arguments for an omni pitch bend with the LSB/MSB slots zeroed
+_OMNI_RECORDS = struct.Struct('<' + 'I4B' * 16)
+_OMNI_PITCH_BEND_ARGS = tuple(value for channel in range(16) for value in (0, 3, 0xE0 | channel, 0, 0))
+
+# Sort key for unpacked records: the frame offset
+_record_offset = itemgetter(0)
+
+# SCHED_FIFO priority requested for the process callback thread if Jack didn't
+# already run it with real-time scheduling
+_CALLBACK_RT_PRIORITY = 10
+
+# Ring buffer capacity in bytes (8192 records)
+_RING_SIZE = 65536
+
+# Ring buffer space (512 records) only note-offs may use: when the buffer
+# saturates, new note-ons and bends are dropped first so the note-offs for
+# notes already sounding still get through and nothing is left stuck
+_NOTE_OFF_RESERVE = 512 * _MIDI_RECORD_SIZE
+
+# Sharp note name and octave indexed by MIDI note number
+_MIDI_TO_NOTATION = tuple(Note.sharp_notations[i % 12] for i in range(128))
+_MIDI_TO_OCTAVE = tuple(i // 12 - 1 for i in range(128))
 
+# Synth engines tried (in priority order) when no Zynthian router is present
+_COMMON_SYNTHS = ('ZynAddSubFX', 'setBfree', 'FluidSynth', 'LinuxSampler')
+
+# Ports never picked as a fallback synth (matched against the lowercased port name),
+# plus ALSA's "Midi Through" port (matched case-sensitively)
+_EXCLUDED_PORTS = ('strumboli', 'system', 'ttymidi', 'a2j')
+_MIDI_THROUGH = 'Midi Through'
+
+
+@functools.lru_cache(maxsize=256)
+def _notation_to_midi(notation: str, octave: int) -> int:
+    """Note.notation_to_midi for a notation/octave pair, cached (strumming reuses a few notes)."""
+    return Note.notation_to_midi(notation + str(octave))
 
 """
     Please note that the auto-connect logic is very Zynthian specific
@@ -20,9 +77,15 @@ class JackMidi(EventEmitter):
     Outputs MIDI through Jack Audio Connection Kit for integration with Zynthian and other Jack-based systems.
     
     IMPORTANT: Jack MIDI events must be sent from within the process callback for real-time performance.
-    This implementation uses a queue to pass events from Python threads to the Jack process callback.
+    This implementation uses a lock-free jack.RingBuffer to pass events from Python threads to the
+    Jack process callback. Producers serialize their writes with a lock; the callback never takes one.
     """
     
+    # Channel voice status bytes indexed by zero-based channel
+    _NOTE_ON = bytes(range(0x90, 0xA0))
+    _NOTE_OFF = bytes(range(0x80, 0x90))
+    _PITCH_BEND = bytes(range(0xE0, 0xF0))
+    
     def __init__(self, midi_strum_channel: Optional[int] = None, client_name: str = "midi_strummer"):
         super().__init__()
         
@@ -34,19 +97,59 @@ class JackMidi(EventEmitter):
         
         self.client_name = client_name
         self._midi_strum_channel: Optional[int] = midi_strum_channel
-        self._notes: List[str] = []
-        self._active_note_timers: dict = {}  # Track active note-off timers
+        # 0-based output channels and their 16-bit bitmap, swapped together on change
+        self._channels: Tuple[Tuple[int, ...], int] = self._channels_for(midi_strum_channel)
+        self._notes: List[str] = []  # Held input notes, kept sorted by Note.sort_key
+        self._note_sort_keys: List[Tuple[int, int]] = []  # Note.sort_key of each entry in _notes
+        # Sounding notes keyed by midi_note << 16 | channel bitmap, mapped to
+        # (pending note-off seq, start time in monotonic ns)
+        self._active_notes: Dict[int, Tuple[int, int]] = {}
+        # Guards the note-off heap only. Cancelling a note-off and recording a note
+        # are single dict operations (atomic under the GIL), so the send/release
+        # fast path never takes this lock
         self._timer_lock = threading.Lock()
-        self._note_start_times: dict = {}  # Track when each note started
+        
+        # Note-offs are scheduled on one long-lived thread instead of a Timer per note.
+        # Heap entries are (deadline_ns, seq, note_key, midi_note, channels); an entry only
+        # fires if its seq is still the note key's entry in _active_notes, so
+        # cancelling is just removing the key (the heap entry becomes a tombstone)
+        self._note_off_heap: List[Tuple[int, int, int, int, Tuple[int, ...]]] = []
+        self._note_off_cv = threading.Condition(self._timer_lock)
+        self._note_off_seq = itertools.count()
+        # Cleared by close() to stop the note-off scheduler and event pump threads
+        self._running = True
+        self._scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
+        self._scheduler_thread.start()
         
         # Jack client and ports
         self.jack_client: Optional[jack.Client] = None
         self.midi_out_port: Optional[jack.MidiPort] = None
         self.midi_in_port: Optional[jack.MidiPort] = None
-        
-        # MIDI event queue for real-time processing
-        # Queue items are tuples: (timestamp_offset, midi_message_bytes)
-        self._midi_queue: queue.Queue = queue.Queue(maxsize=1000)
+        self._auto_connect_mode: Optional[str] = None  # Config's jack_auto_connect, read on first connect
+        self._callback_rt_checked = False  # Process callback thread scheduling checked
+        
+        # Ring buffer of fixed-size _MIDI_RECORD frames read by the process callback
+        # (allocated in refresh_connection). Several threads produce MIDI, so writes
+        # are serialized by a producer-side lock; the single reader needs none
+        self._midi_ring: Optional['jack.RingBuffer'] = None
+        self._ring_write_lock = threading.Lock()
+        self._drained: List[Tuple[int, int, bytes]] = []  # Records drained per cycle (reused)
+        
+        # Incoming MIDI is copied by the process callback into this ring buffer and
+        # decoded on a worker thread, keeping note tracking and event emission
+        # out of the Jack audio thread
+        self._input_ring: Optional['jack.RingBuffer'] = None
+        self._input_ready = threading.Event()
+        self._input_thread: Optional[threading.Thread] = None
+        self._input_running = False
+        
+        # Note events are handed to a pump thread that runs the subscribers, so a
+        # slow listener never stalls input decoding. Records are (added, removed,
+        # notes); if listeners fall far behind the oldest records are dropped
+        self._out_events: collections.deque = collections.deque(maxlen=256)
+        self._out_cv = threading.Condition()
+        self._emit_thread = threading.Thread(target=self._emit_pump, daemon=True)
+        self._emit_thread.start()
         
         # Debug tracking
         self._events_sent_count: int = 0
@@ -65,6 +168,13 @@ class JackMidi(EventEmitter):
         """Get current notes"""
         return self._notes
     
+    @staticmethod
+    def _channels_for(channel: Optional[int]) -> Tuple[Tuple[int, ...], int]:
+        """0-based channels (and their bitmap) to send on for a 1-16 channel, or all 16 for None (omni)"""
+        if channel is not None:
+            return (channel - 1,), 1 << (channel - 1)
+        return tuple(range(16)), 0xFFFF
+    
     def set_midi_channel(self, channel: Optional[int]) -> None:
         """
         Update the MIDI output channel dynamically.
@@ -73,6 +183,7 @@ class JackMidi(EventEmitter):
             channel: MIDI channel (1-16), or None to send on all channels
         """
         self._midi_strum_channel = channel
+        self._channels = self._channels_for(channel)
         if channel is not None:
             print(f"[Jack MIDI] MIDI channel set to: {channel}")
         else:
@@ -81,8 +192,27 @@ class JackMidi(EventEmitter):
     def refresh_connection(self, midi_input_id: Optional[str] = None, midi_output_id: Optional[str] = None) -> None:
         """Initialize Jack MIDI connections (midi_output_id is ignored for Jack)"""
         try:
-            # Create Jack client
-            self.jack_client = jack.Client(self.client_name)
+            # Outgoing MIDI ring buffer, ready before anything can be queued or the
+            # process callback can run
+            self._midi_ring = jack.RingBuffer(_RING_SIZE)
+            self._input_ring = jack.RingBuffer(_RING_SIZE)
+            
+            # Lock both ring buffers into RAM so the process callback never page-faults
+            # on them (needs a sufficient memlock limit; without it they stay pageable)
+            for ring in (self._midi_ring, self._input_ring):
+                try:
+                    ring.mlock()
+                except jack.JackError:
+                    pass
+            
+            # Start the input decoding worker (once; it survives reconnects)
+            if self._input_thread is None or not self._input_thread.is_alive():
+                self._input_running = True
+                self._input_thread = threading.Thread(target=self._input_worker, daemon=True)
+                self._input_thread.start()
+            
+            # Create Jack client (connect to a running server; never spawn one)
+            self.jack_client = jack.Client(self.client_name, no_start_server=True)
             
             # Register MIDI output port with is_physical=True to expose in MIDI menus
             # Use descriptive name that will appear in port list
@@ -101,15 +231,15 @@ class JackMidi(EventEmitter):
             print(f"[Jack MIDI] ✓ MIDI output: {self.midi_out_port.name}")
             
             # Auto-connect to ZynMidiRouter if available (for Zynthian)
-            # Get auto-connect mode from config if available
-            auto_connect_mode = "chain0"  # default
-            try:
-                from config import Config
-                cfg = Config()
-                auto_connect_mode = cfg.jack_auto_connect
-            except:
-                pass
-            self._auto_connect_to_synths(mode=auto_connect_mode)
+            # Get auto-connect mode from config if available (read once, then cached)
+            if self._auto_connect_mode is None:
+                self._auto_connect_mode = "chain0"  # default
+                if Config is not None:
+                    try:
+                        self._auto_connect_mode = Config().jack_auto_connect
+                    except Exception:
+                        pass
+            self._auto_connect_to_synths(mode=self._auto_connect_mode)
             
             # Emit connection event
             self.emit(
@@ -137,40 +267,82 @@ class JackMidi(EventEmitter):
         Jack process callback for handling incoming/outgoing MIDI.
         This runs in the Jack audio thread - keep it real-time safe!
         """
+        if not self._callback_rt_checked:
+            self._promote_callback_thread()
+        
         # Clear the output port buffer
         self.midi_out_port.clear_buffer()
         
-        # Send all queued MIDI events
+        # Send all queued MIDI events (whole records only; producers write full records).
+        # Every available record is read at once, then written in ascending frame
+        # offset order as Jack requires (the sort is stable, so same-offset events keep
+        # their queued order); offsets past this cycle are clamped to its last frame
         events_sent = 0
-        while not self._midi_queue.empty():
-            try:
-                offset, midi_message = self._midi_queue.get_nowait()
-                self.midi_out_port.write_midi_event(offset, midi_message)
-                events_sent += 1
-            except queue.Empty:
-                break
-            except Exception as e:
-                # Store exception for later (can't print in callback)
-                self._last_callback_error = str(e)
+        ring = self._midi_ring
+        available = ring.read_space // _MIDI_RECORD_SIZE
+        if available:
+            drained = self._drained
+            drained.extend(_MIDI_RECORD.iter_unpack(ring.read(available * _MIDI_RECORD_SIZE)))
+            drained.sort(key=_record_offset)
+            last_frame = frames - 1
+            write_midi_event = self.midi_out_port.write_midi_event
+            for offset, length, midi_message in drained:
+                try:
+                    write_midi_event(min(offset, last_frame), midi_message[:length])
+                    events_sent += 1
+                except Exception as e:
+                    # Store exception for later (can't print in callback); a single
+                    # slot, so repeated failures can't accumulate
+                    self._last_callback_error = str(e)
+            drained.clear()
         
         # Debug: track if we're sending events
-        if events_sent > 0:
-            self._events_sent_count = getattr(self, '_events_sent_count', 0) + events_sent
+        if events_sent:
+            self._events_sent_count += events_sent
         
-        # Process incoming MIDI events
+        # Hand incoming MIDI events to the input worker; only raw bytes are copied here
+        received = False
+        input_ring = self._input_ring
         for offset, data in self.midi_in_port.incoming_midi_events():
-            if len(data) >= 3:
-                command, note, velocity = data[0], data[1], data[2]
-                notation_list = [*Note.sharp_notations, *Note.sharp_notations]
-                notation = notation_list[note % len(Note.sharp_notations)]
-                octave = note // len(Note.sharp_notations) - 1
+            if len(data) >= 3 and input_ring.write_space >= _MIDI_RECORD_SIZE:
+                input_ring.write(_MIDI_RECORD.pack(offset, 3, bytes(data[:3])))
+                received = True
+        if received:
+            self._input_ready.set()
+    
+    def _promote_callback_thread(self) -> None:
+        """
+        Give the calling (Jack process) thread SCHED_FIFO scheduling if it runs as
+        SCHED_OTHER, e.g. when the Jack server itself isn't running real-time.
+        Runs once; without permission (EPERM) or OS support it is silently skipped.
+        """
+        self._callback_rt_checked = True
+        try:
+            if os.sched_getscheduler(0) == os.SCHED_OTHER:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_CALLBACK_RT_PRIORITY))
+        except (AttributeError, OSError):
+            pass
+    
+    def _input_worker(self) -> None:
+        """Decode incoming MIDI records from the process callback into note events."""
+        while self._input_running:
+            self._input_ready.wait()
+            self._input_ready.clear()
+            
+            input_ring = self._input_ring
+            while input_ring is not None and input_ring.read_space >= _MIDI_RECORD_SIZE:
+                _, _, (command, note, velocity) = _MIDI_RECORD.unpack(input_ring.read(_MIDI_RECORD_SIZE))
+                if command != 0x90 and command != 0x80:
+                    continue  # Only note on/off are tracked
+                notation = _MIDI_TO_NOTATION[note]
+                octave = _MIDI_TO_OCTAVE[note]
                 
                 if command == 0x90:  # Note on message
                     if velocity > 0:
                         self.on_note_down(notation, octave)
                     else:
                         self.on_note_up(notation, octave)
-                elif command == 0x80:  # Note off message
+                else:  # Note off message
                     self.on_note_up(notation, octave)
     
     def _auto_connect_to_synths(self, mode: str = "chain0") -> None:
@@ -193,12 +365,31 @@ class JackMidi(EventEmitter):
             # Get all MIDI input ports
             all_ports = self.jack_client.get_ports(is_midi=True, is_input=True)
             
+            # Bucket the candidates for every connection strategy in a single pass
+            chain_ports = []  # All ZynMidiRouter chain inputs
+            chain0_port = None  # ZynMidiRouter chain 0 input
+            synth_ports = {}  # First MIDI input per common synth
+            user_synth = None  # First port that isn't system/internal
+            for port in all_ports:
+                name = port.name
+                lower_name = name.lower()
+                if 'ZynMidiRouter' in name and 'dev' in name and '_in' in name:
+                    chain_ports.append(port)
+                    if chain0_port is None and 'dev0_in' in name:
+                        chain0_port = port
+                if 'midi_in' in lower_name:
+                    for synth_name in _COMMON_SYNTHS:
+                        if synth_name in name and synth_name not in synth_ports:
+                            synth_ports[synth_name] = port
+                if (user_synth is None and _MIDI_THROUGH not in name
+                        and not any(excluded in lower_name for excluded in _EXCLUDED_PORTS)):
+                    user_synth = port
+            
             if mode == "all-chains":
                 # Connect to ALL ZynMidiRouter chains
-                zyn_router_ports = [p for p in all_ports if 'ZynMidiRouter' in p.name and 'dev' in p.name and '_in' in p.name]
-                if zyn_router_ports:
+                if chain_ports:
                     connected_count = 0
-                    for port in zyn_router_ports:
+                    for port in chain_ports:
                         try:
                             self.jack_client.connect(self.midi_out_port, port)
                             connected_count += 1
@@ -210,39 +401,30 @@ class JackMidi(EventEmitter):
                         return
             
             # Default: Connect to Chain 0 only
-            zyn_router_ports = [p for p in all_ports if 'ZynMidiRouter' in p.name and 'dev0_in' in p.name]
-            if zyn_router_ports:
+            if chain0_port is not None:
                 try:
-                    self.jack_client.connect(self.midi_out_port, zyn_router_ports[0])
+                    self.jack_client.connect(self.midi_out_port, chain0_port)
                     print(f"[Jack MIDI] ✓ Connected to Zynthian (Chain 0)")
                     return
                 except Exception as e:
                     pass  # Try other connection methods
             
             # Priority 2: Try common synth engines
-            common_synths = ['ZynAddSubFX', 'setBfree', 'FluidSynth', 'LinuxSampler']
-            for synth_name in common_synths:
-                synth_ports = [p for p in all_ports if synth_name in p.name and 'midi_in' in p.name.lower()]
-                if synth_ports:
+            for synth_name in _COMMON_SYNTHS:
+                synth_port = synth_ports.get(synth_name)
+                if synth_port is not None:
                     try:
-                        self.jack_client.connect(self.midi_out_port, synth_ports[0])
+                        self.jack_client.connect(self.midi_out_port, synth_port)
                         print(f"[Jack MIDI] ✓ Connected to {synth_name}")
                         return
                     except Exception as e:
                         pass  # Try next synth
             
             # Priority 3: Try first available synth (excluding system/internal ports)
-            user_synths = [p for p in all_ports 
-                          if 'strumboli' not in p.name.lower() 
-                          and 'system' not in p.name.lower()
-                          and 'ttymidi' not in p.name.lower()
-                          and 'a2j' not in p.name.lower()
-                          and 'Midi Through' not in p.name]
-            
-            if user_synths:
+            if user_synth is not None:
                 try:
-                    self.jack_client.connect(self.midi_out_port, user_synths[0])
-                    print(f"[Jack MIDI] ✓ Connected to {user_synths[0].name}")
+                    self.jack_client.connect(self.midi_out_port, user_synth)
+                    print(f"[Jack MIDI] ✓ Connected to {user_synth.name}")
                     return
                 except Exception as e:
                     pass
@@ -255,13 +437,32 @@ class JackMidi(EventEmitter):
     
     def _queue_midi_event(self, midi_message: bytes, offset: int = 0) -> None:
         """
-        Queue a MIDI event to be sent in the next process callback.
+        Queue a MIDI event (up to 3 bytes) to be sent in the next process callback.
         This is thread-safe and can be called from any thread.
         """
-        try:
-            self._midi_queue.put_nowait((offset, midi_message))
-        except queue.Full:
-            print("[Jack MIDI] Warning: MIDI queue full, dropping event")
+        reserve = 0 if midi_message[0] & 0xF0 == 0x80 else _NOTE_OFF_RESERVE
+        self._write_record(_MIDI_RECORD.pack(offset, len(midi_message), midi_message), reserve)
+    
+    def _queue_short_message(self, status: int, data1: int, data2: int, offset: int = 0) -> None:
+        """Queue a 3-byte MIDI message given as ints (see _queue_midi_event)."""
+        reserve = 0 if status & 0xF0 == 0x80 else _NOTE_OFF_RESERVE
+        self._write_record(_SHORT_MESSAGE_RECORD.pack(offset, 3, status, data1, data2), reserve)
+    
+    def _write_record(self, record: bytes, reserve: int = _NOTE_OFF_RESERVE) -> None:
+        """
+        Write packed record(s) to the outgoing ring buffer, dropping them if full.
+        
+        Args:
+            record: One or more packed _MIDI_RECORD frames
+            reserve: Free space (bytes) that must remain after the write; note-offs
+                pass 0 so they can use the space held back from everything else
+        """
+        with self._ring_write_lock:
+            # Only whole records are written so the callback never sees a partial one
+            if self._midi_ring.write_space >= len(record) + reserve:
+                self._midi_ring.write(record)
+                return
+        print("[Jack MIDI] Warning: MIDI queue full, dropping event")
     
     def send_pitch_bend(self, bend_value: float) -> None:
         """
@@ -284,16 +485,16 @@ class JackMidi(EventEmitter):
         lsb = midi_bend & 0x7F
         msb = (midi_bend >> 7) & 0x7F
         
-        # Determine which channels to send on
-        if self._midi_strum_channel is not None:
-            channels = [self._midi_strum_channel - 1]
-        else:
-            channels = list(range(16))
-        
         # Queue pitch bend messages (0xE0 + channel)
-        for channel in channels:
-            pitch_bend_message = bytes([0xE0 + channel, lsb, msb])
-            self._queue_midi_event(pitch_bend_message)
+        channels = self._channels[0]
+        if len(channels) == 1:
+            self._queue_short_message(self._PITCH_BEND[channels[0]], lsb, msb)
+        else:
+            # Omni: all 16 channels packed into one ring buffer write
+            args = list(_OMNI_PITCH_BEND_ARGS)
+            args[3::5] = (lsb,) * 16
+            args[4::5] = (msb,) * 16
+            self._write_record(_OMNI_RECORDS.pack(*args))
     
     def release_notes(self, notes: List[NoteObject]) -> None:
         """Immediately release specific notes by canceling timers and sending note-offs"""
@@ -301,82 +502,124 @@ class JackMidi(EventEmitter):
             return
         
         # Determine which channels to send on
-        if self._midi_strum_channel is not None:
-            channels = [self._midi_strum_channel - 1]
-        else:
-            channels = list(range(16))
+        channels, channel_mask = self._channels
         
         # Convert notes to MIDI note numbers and release them
         for note in notes:
-            midi_note = Note.notation_to_midi(note.notation + str(note.octave))
-            note_key = (midi_note, tuple(channels))
+            midi_note = _notation_to_midi(note.notation, note.octave)
             
-            # Cancel the timer if it exists
-            with self._timer_lock:
-                if note_key in self._active_note_timers:
-                    timer = self._active_note_timers[note_key]
-                    timer.cancel()
-                    del self._active_note_timers[note_key]
-                if note_key in self._note_start_times:
-                    del self._note_start_times[note_key]
+            # Cancel the pending note-off if it exists
+            self._active_notes.pop(midi_note << 16 | channel_mask, None)
             
             # Queue note-off messages
             for channel in channels:
-                note_off_message = bytes([0x80 + channel, midi_note, 0x40])
-                self._queue_midi_event(note_off_message)
+                self._queue_short_message(self._NOTE_OFF[channel], midi_note, 0x40)
     
     def send_note(self, note: NoteObject, velocity: int, duration: float = 1.5) -> None:
         """Send a MIDI note with non-blocking note-off"""
         if not self.jack_client or not self.midi_out_port:
             return
         
-        midi_note = Note.notation_to_midi(note.notation + str(note.octave))
+        midi_note = _notation_to_midi(note.notation, note.octave)
         
         # Determine which channels to send on
-        if self._midi_strum_channel is not None:
-            channels = [self._midi_strum_channel - 1]
-        else:
-            channels = list(range(16))
+        channels, channel_mask = self._channels
         
         # Create unique key for this note+channels combination
-        note_key = (midi_note, tuple(channels))
+        note_key = midi_note << 16 | channel_mask
         
-        # Cancel any existing timer for this note to prevent premature note-off
-        with self._timer_lock:
-            if note_key in self._active_note_timers:
-                old_timer = self._active_note_timers[note_key]
-                old_timer.cancel()
-                del self._active_note_timers[note_key]
+        # Cancel any pending note-off for this note to prevent premature note-off
+        self._active_notes.pop(note_key, None)
         
         # Queue note-on messages
         for channel in channels:
-            note_on_message = bytes([0x90 + channel, midi_note, velocity])
-            self._queue_midi_event(note_on_message)
+            self._queue_short_message(self._NOTE_ON[channel], midi_note, velocity)
+        
+        # Schedule the note-off (replaces any pending one for this note)
+        self._schedule_note_off(note_key, midi_note, channels, duration)
+    
+    def send_notes_batch(self, notes: Sequence[Tuple[NoteObject, int]], duration: float = 1.5) -> None:
+        """
+        Send several MIDI notes at once with non-blocking note-offs.
         
-        # Track when this note started
-        with self._timer_lock:
-            self._note_start_times[note_key] = time.time()
+        All note-ons go into the ring buffer as a single write and all note-offs
+        are scheduled under one lock acquisition.
         
-        # Schedule note-off with a timer that can be cancelled
-        def send_note_off():
-            if self.jack_client and self.midi_out_port:
-                for channel in channels:
-                    note_off_message = bytes([0x80 + channel, midi_note, 0x40])
-                    self._queue_midi_event(note_off_message)
+        Args:
+            notes: (note, velocity) pairs to play
+            duration: Duration in seconds before note-off
+        """
+        if not self.jack_client or not self.midi_out_port or not notes:
+            return
+        
+        channels, channel_mask = self._channels
+        note_on = self._NOTE_ON
+        pack = _SHORT_MESSAGE_RECORD.pack
+        records = []
+        scheduled = []
+        for note, velocity in notes:
+            midi_note = _notation_to_midi(note.notation, note.octave)
+            note_key = midi_note << 16 | channel_mask
+            
+            # Cancel any pending note-off for this note to prevent premature note-off
+            self._active_notes.pop(note_key, None)
+            
+            for channel in channels:
+                records.append(pack(0, 3, note_on[channel], midi_note, velocity))
+            scheduled.append((note_key, midi_note))
+        
+        self._write_record(b''.join(records))
+        self._schedule_note_offs(scheduled, channels, duration)
+    
+    def _schedule_note_off(self, note_key: int, midi_note: int, channels: Tuple[int, ...], duration: float) -> None:
+        """Record note_key as sounding from now and schedule its note-off after duration seconds"""
+        self._schedule_note_offs(((note_key, midi_note),), channels, duration)
+    
+    def _schedule_note_offs(self, notes: Sequence[Tuple[int, int]], channels: Tuple[int, ...], duration: float) -> None:
+        """Record each (note_key, midi_note) as sounding from now and schedule their note-offs after duration seconds"""
+        start = time.monotonic_ns()
+        deadline = start + int(duration * 1e9)
+        heap = self._note_off_heap
+        with self._note_off_cv:
+            earliest = heap[0][0] if heap else None
+            for note_key, midi_note in notes:
+                seq = next(self._note_off_seq)
+                self._active_notes[note_key] = (seq, start)
+                heapq.heappush(heap, (deadline, seq, note_key, midi_note, channels))
+            # Only wake the scheduler if these note-offs are now the earliest
+            if earliest is None or deadline < earliest:
+                self._note_off_cv.notify()
+    
+    def _scheduler_loop(self) -> None:
+        """Send note-offs as their deadlines pass (runs until close())"""
+        heap = self._note_off_heap
+        while True:
+            due = []
+            with self._note_off_cv:
+                while not due:
+                    if not self._running:
+                        return
+                    if not heap:
+                        self._note_off_cv.wait()
+                        continue
+                    wait_ns = heap[0][0] - time.monotonic_ns()
+                    if wait_ns > 0:
+                        self._note_off_cv.wait(wait_ns / 1e9)
+                        continue
+                    # Pop everything that is due; skip cancelled or superseded entries
+                    now = time.monotonic_ns()
+                    while heap and heap[0][0] <= now:
+                        _, seq, note_key, midi_note, channels = heapq.heappop(heap)
+                        active = self._active_notes.get(note_key)
+                        if active is not None and active[0] == seq:
+                            # A producer may cancel concurrently, so pop rather than del
+                            self._active_notes.pop(note_key, None)
+                            due.append((midi_note, channels))
             
-            # Remove this timer from active timers
-            with self._timer_lock:
-                if note_key in self._active_note_timers:
-                    del self._active_note_timers[note_key]
-                if note_key in self._note_start_times:
-                    del self._note_start_times[note_key]
-        
-        # Create and store the timer
-        timer = threading.Timer(duration, send_note_off)
-        timer.daemon = True
-        with self._timer_lock:
-            self._active_note_timers[note_key] = timer
-        timer.start()
+            if self.jack_client and self.midi_out_port:
+                for midi_note, channels in due:
+                    for channel in channels:
+                        self._queue_short_message(self._NOTE_OFF[channel], midi_note, 0x40)
     
     def send_raw_note(self, midi_note: int, velocity: int, channel: Optional[int] = None, duration: float = 1.5) -> None:
         """
@@ -392,86 +635,68 @@ class JackMidi(EventEmitter):
             return
         
         # Determine which channel to send on
-        if channel is not None:
-            channels = [channel - 1]
-        elif self._midi_strum_channel is not None:
-            channels = [self._midi_strum_channel - 1]
+        if channel is None:
+            channels, channel_mask = self._channels
         else:
-            channels = list(range(16))
+            channels, channel_mask = (channel - 1,), 1 << (channel - 1)
         
         # Create unique key for this note+channels combination
-        note_key = (midi_note, tuple(channels))
+        note_key = midi_note << 16 | channel_mask
         
-        # Cancel any existing timer for this note to prevent premature note-off
-        with self._timer_lock:
-            if note_key in self._active_note_timers:
-                old_timer = self._active_note_timers[note_key]
-                old_timer.cancel()
-                del self._active_note_timers[note_key]
+        # Cancel any pending note-off for this note to prevent premature note-off
+        self._active_notes.pop(note_key, None)
         
         # Queue note-on messages
         for ch in channels:
-            note_on_message = bytes([0x90 + ch, midi_note, velocity])
-            self._queue_midi_event(note_on_message)
-        
-        # Track when this note started
-        with self._timer_lock:
-            self._note_start_times[note_key] = time.time()
-        
-        # Schedule note-off with a timer that can be cancelled
-        def send_note_off():
-            if self.jack_client and self.midi_out_port:
-                for ch in channels:
-                    note_off_message = bytes([0x80 + ch, midi_note, 0x40])
-                    self._queue_midi_event(note_off_message)
-            
-            # Remove this timer from active timers
-            with self._timer_lock:
-                if note_key in self._active_note_timers:
-                    del self._active_note_timers[note_key]
-                if note_key in self._note_start_times:
-                    del self._note_start_times[note_key]
+            self._queue_short_message(self._NOTE_ON[ch], midi_note, velocity)
         
-        timer = threading.Timer(duration, send_note_off)
-        timer.daemon = True
-        
-        # Store timer to allow cancellation
-        with self._timer_lock:
-            self._active_note_timers[note_key] = timer
-        
-        timer.start()
+        # Schedule the note-off (replaces any pending one for this note)
+        self._schedule_note_off(note_key, midi_note, channels, duration)
     
     def on_note_down(self, notation: str, octave: int) -> None:
         """Handle note down event"""
         note_str = notation + str(octave)
         if note_str not in self._notes:
-            self._notes.append(note_str)
-            self._notes = Note.sort(self._notes)
-            
-            # Emit event with proper event object
-            self.emit(
-                NOTE_EVENT,
-                MidiNoteEvent(
-                    notes=self._notes.copy(),
-                    added=note_str
-                )
-            )
+            # Insert in sorted position (after equal keys, as a stable sort would)
+            sort_key = Note.sort_key(note_str)
+            index = bisect.bisect_right(self._note_sort_keys, sort_key)
+            self._note_sort_keys.insert(index, sort_key)
+            self._notes.insert(index, note_str)
+            self._post_note_event(note_str, None)
     
     def on_note_up(self, notation: str, octave: int) -> None:
         """Handle note up event"""
         note_str = notation + str(octave)
         if note_str in self._notes:
-            self._notes.remove(note_str)
-            self._notes = Note.sort(self._notes)
+            # Removing keeps the list sorted
+            index = self._notes.index(note_str)
+            del self._notes[index]
+            del self._note_sort_keys[index]
+            self._post_note_event(None, note_str)
+    
+    def _post_note_event(self, added: Optional[str], removed: Optional[str]) -> None:
+        """Queue a note event (with a snapshot of the held notes) for the emit pump"""
+        with self._out_cv:
+            self._out_events.append((added, removed, tuple(self._notes)))
+            self._out_cv.notify()
+    
+    def _emit_pump(self) -> None:
+        """Emit queued note events to subscribers (runs until close())"""
+        events = self._out_events
+        while True:
+            with self._out_cv:
+                while not events and self._running:
+                    self._out_cv.wait()
+                if not self._running:
+                    return
+                pending = list(events)
+                events.clear()
             
-            # Emit event with proper event object
-            self.emit(
-                NOTE_EVENT,
-                MidiNoteEvent(
-                    notes=self._notes.copy(),
-                    removed=note_str
+            for added, removed, notes in pending:
+                self.emit(
+                    NOTE_EVENT,
+                    MidiNoteEvent(notes=notes, added=added, removed=removed)
                 )
-            )
     
     def choose_input(self, input_id: str) -> None:
         """Choose MIDI input - for Jack, this is handled via external connections"""
@@ -480,12 +705,25 @@ class JackMidi(EventEmitter):
     
     def close(self) -> None:
         """Close Jack MIDI connections"""
-        # Cancel all active note timers
-        with self._timer_lock:
-            for timer in self._active_note_timers.values():
-                timer.cancel()
-            self._active_note_timers.clear()
-            self._note_start_times.clear()
+        # Stop the input decoding worker
+        self._input_running = False
+        self._input_ready.set()
+        
+        # Cancel all pending note-offs and wake the scheduler and event pump so they exit
+        self._running = False
+        with self._note_off_cv:
+            self._active_notes.clear()
+            self._note_off_heap.clear()
+            self._note_off_cv.notify()
+        with self._out_cv:
+            self._out_events.clear()
+            self._out_cv.notify()
+        
+        # close() may run on one of these threads (e.g. from an event subscriber)
+        current = threading.current_thread()
+        for thread in (self._input_thread, self._scheduler_thread, self._emit_thread):
+            if thread is not None and thread is not current:
+                thread.join(timeout=1.0)
         
         if self.jack_client:
             try:
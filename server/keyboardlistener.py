@@ -14,7 +14,8 @@ import threading
 class KeyboardListener:
     """Monitors keyboard events and maps them to tablet button presses"""
     
-    def __init__(self, key_mappings: Dict[str, Any], button_callback: Callable[[int, bool], None]):
+    def __init__(self, key_mappings: Dict[str, Any], button_callback: Callable[[int, bool], None],
+                 verbose: bool = False):
         """
         Initialize keyboard listener
         
@@ -22,9 +23,12 @@ class KeyboardListener:
             key_mappings: Dictionary mapping button numbers to key configurations
                          Format: {"1": {"key": "b", "code": "KeyB"}, ...}
             button_callback: Callback function(button_num: int, pressed: bool)
+            verbose: Log every button press/release (stdout writes from the
+                     listener thread can stall event dispatch on a slow terminal)
         """
         self.key_mappings = key_mappings
         self.button_callback = button_callback
+        self.verbose = verbose
         self.listener: Optional[keyboard.Listener] = None
         self.button_states: Dict[int, bool] = {}
         self.lock = threading.Lock()
@@ -33,125 +37,99 @@ class KeyboardListener:
         for button_num in key_mappings.keys():
             self.button_states[int(button_num)] = False
         
+        # Key -> button lookups, resolved once from the mappings
+        self._char_to_button: Dict[str, int] = {}
+        self._name_to_button: Dict[str, int] = {}
+        self._build_lookups()
+        
         print(f"[Keyboard] Initialized with {len(key_mappings)} button mappings")
     
-    def _matches_mapping(self, key_obj, mapping: Dict[str, Any]) -> bool:
+    def _build_lookups(self) -> None:
         """
-        Check if a keyboard event matches a button mapping
+        Precompute key -> button lookups from the key mappings
         
-        Args:
-            key_obj: pynput Key object
-            mapping: Button key mapping configuration
-            
-        Returns:
-            True if the key matches the mapping
+        Resolves each mapping's key and code into the characters and key
+        names it matches, so press/release handling is a single dict lookup.
+        When several mappings claim the same key, the first one wins.
         """
-        try:
-            # Get key character or name
-            key_char = None
-            key_name = None
-            
-            if hasattr(key_obj, 'char') and key_obj.char:
-                key_char = key_obj.char
-            elif hasattr(key_obj, 'name'):
-                key_name = key_obj.name
-            
-            # Check if key matches (by char or name)
+        for button_num_str, mapping in self.key_mappings.items():
+            button_num = int(button_num_str)
             mapping_key = mapping.get('key', '')
-            if key_char and key_char == mapping_key:
-                return True
-            if key_name and key_name == mapping_key.lower():
-                return True
-            
-            # Alternative: match by key code name
-            # Convert KeyCode names like 'KeyB' to just 'b' for comparison
             mapping_code = mapping.get('code', '')
+            
+            # Match by character or by key name
+            if mapping_key:
+                self._char_to_button.setdefault(mapping_key, button_num)
+                self._name_to_button.setdefault(mapping_key.lower(), button_num)
+            
+            # Convert KeyCode names like 'KeyB' to just 'b' (either case)
             if mapping_code.startswith('Key') and len(mapping_code) > 3:
                 code_char = mapping_code[3:].lower()
-                if key_char and key_char.lower() == code_char:
-                    return True
-                if key_name and key_name.lower() == code_char:
-                    return True
+                self._char_to_button.setdefault(code_char, button_num)
+                self._char_to_button.setdefault(code_char.upper(), button_num)
+                self._name_to_button.setdefault(code_char, button_num)
             
             # Handle bracket keys
-            if mapping_code == 'BracketLeft' and key_char == '[':
-                return True
-            if mapping_code == 'BracketRight' and key_char == ']':
-                return True
+            if mapping_code == 'BracketLeft':
+                self._char_to_button.setdefault('[', button_num)
+            elif mapping_code == 'BracketRight':
+                self._char_to_button.setdefault(']', button_num)
             
             # Handle numpad keys
             if 'Numpad' in mapping_code:
-                if 'Add' in mapping_code and key_char == '+':
-                    return True
-                if 'Subtract' in mapping_code and key_char == '-':
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            print(f"[Keyboard] Error matching key: {e}")
-            return False
+                if 'Add' in mapping_code:
+                    self._char_to_button.setdefault('+', button_num)
+                if 'Subtract' in mapping_code:
+                    self._char_to_button.setdefault('-', button_num)
     
-    def _check_modifiers(self, mapping: Dict[str, Any]) -> bool:
-        """
-        Check if current modifier keys match the mapping
-        
-        Args:
-            mapping: Button key mapping configuration
-            
-        Returns:
-            True if modifiers match (or no modifiers required)
-        """
-        # For now, we'll rely on the key combination matching
-        # pynput doesn't easily expose current modifier state in callbacks
-        # TODO: Track ctrl/shift/alt/meta state if needed
-        return True
+    def _lookup_button(self, key) -> Optional[int]:
+        """Return the button number mapped to a pynput key, if any (one attribute read each)"""
+        key_char = getattr(key, 'char', None)
+        if key_char:
+            return self._char_to_button.get(key_char)
+        key_name = getattr(key, 'name', None)
+        if key_name:
+            return self._name_to_button.get(key_name)
+        return None
     
     def _on_press(self, key):
         """Handle key press event"""
         try:
-            # Check each button mapping
-            for button_num_str, mapping in self.key_mappings.items():
-                button_num = int(button_num_str)
-                
-                if self._matches_mapping(key, mapping):
-                    # Check modifiers (basic check - pynput has limitations here)
-                    # For keys with modifiers like Ctrl+Z, pynput will see them together
-                    
-                    with self.lock:
-                        # Only trigger if not already pressed (avoid key repeat)
-                        if not self.button_states.get(button_num, False):
-                            self.button_states[button_num] = True
-                            print(f"[Keyboard] Button {button_num} pressed")
-                            
-                            # Call the callback
-                            if self.button_callback:
-                                self.button_callback(button_num, True)
-                    
-                    return  # Found the button, no need to check others
+            button_num = self._lookup_button(key)
+            if button_num is None:
+                return
+            
+            with self.lock:
+                # Only trigger if not already pressed (avoid key repeat)
+                if not self.button_states[button_num]:
+                    self.button_states[button_num] = True
+                    if self.verbose:
+                        print(f"[Keyboard] Button {button_num} pressed")
                     
+                    # Call the callback
+                    if self.button_callback:
+                        self.button_callback(button_num, True)
+        
         except Exception as e:
             print(f"[Keyboard] Error in on_press: {e}")
     
     def _on_release(self, key):
         """Handle key release event"""
         try:
-            # Check each button mapping
-            for button_num_str, mapping in self.key_mappings.items():
-                button_num = int(button_num_str)
-                
-                if self._matches_mapping(key, mapping):
-                    with self.lock:
-                        if self.button_states.get(button_num, False):
-                            self.button_states[button_num] = False
-                            print(f"[Keyboard] Button {button_num} released")
-                            
-                            # Call the callback
-                            if self.button_callback:
-                                self.button_callback(button_num, False)
-                    
-                    return
+            button_num = self._lookup_button(key)
+            if button_num is None:
+                return
+            
+            with self.lock:
+                if self.button_states[button_num]:
+                    self.button_states[button_num] = False
+                    if self.verbose:
+                        print(f"[Keyboard] Button {button_num} released")
                     
+                    # Call the callback
+                    if self.button_callback:
+                        self.button_callback(button_num, False)
+        
         except Exception as e:
             print(f"[Keyboard] Error in on_release: {e}")
     
@@ -214,7 +192,7 @@ def test_keyboard_listener():
         state = "PRESSED" if pressed else "RELEASED"
         print(f">>> Button {button_num} {state}")
     
-    listener = KeyboardListener(key_mappings, button_callback)
+    listener = KeyboardListener(key_mappings, button_callback, verbose=True)
     listener.start()
     
     try:
@@ -1,4 +1,3 @@
-import json
 import sys
 import os
 import signal
@@ -6,9 +5,11 @@ import threading
 import time
 import atexit
 import asyncio
-import math
+from math import sqrt
 import argparse
-from typing import Dict, Any, Union, Optional, Callable
+import functools
+import logging
+from typing import Dict, Any, Union, Optional, Callable, Tuple
 from dataclasses import asdict
 
 from finddevice import find_and_open_device, find_and_open_all_interfaces, HotplugMonitor
@@ -17,10 +18,10 @@ from midi import Midi
 from jackmidi import JackMidi
 from midievent import MidiNoteEvent, NOTE_EVENT
 from note import Note
-from websocketserver import SocketServer
+from websocketserver import SocketServer, encode_message
 from webserver import WebServer
 from hidreader import HIDReader
-from datahelpers import apply_effect
+from datahelpers import compile_effect
 from config import Config
 from actions import Actions
 
@@ -48,6 +49,82 @@ _hotplug_monitor = None
 _tablet_connected = False
 _tablet_device_info = None
 
+# Note.parse_notation memoized for the small, fixed set of note strings seen at
+# runtime. The returned NoteObjects are shared between callers and must be
+# treated as read-only (transpose() and fill_note_spread() build new ones)
+_parse_notation = functools.lru_cache(maxsize=256)(Note.parse_notation)
+
+# HID result keys for tablet buttons 1-8
+_BUTTON_KEYS = tuple(f'button{i}' for i in range(1, 9))
+
+
+class HidScratch:
+    """
+    Per-handler state reused across HID reports.
+    
+    Holds the config sections and compiled effects the HID handler uses on every
+    report (refreshed only when the config revision changes) and the control
+    input dict that is updated in place for each report.
+    """
+    
+    __slots__ = (
+        'revision', 'stylus_buttons_cfg', 'tablet_button_actions', 'pitch_bend_fn',
+        'note_duration_fn', 'note_velocity_fn', 'note_repeater_enabled',
+        'repeater_pressure_multiplier', 'repeater_frequency_multiplier', 'strum_release_cfg',
+        'control_inputs'
+    )
+    
+    def __init__(self):
+        self.revision = -1  # Forces a refresh on the first report
+        self.stylus_buttons_cfg: Dict[str, Any] = {}
+        # (0-based index for the frontend, HID result key, configured action, action context label)
+        self.tablet_button_actions: Tuple[Tuple[int, str, Any, str], ...] = ()
+        # Compiled effects: control_inputs -> effect value
+        self.pitch_bend_fn: Callable[[Dict[str, float]], float] = compile_effect({})
+        self.note_duration_fn: Callable[[Dict[str, float]], float] = compile_effect({})
+        self.note_velocity_fn: Callable[[Dict[str, float]], float] = compile_effect({})
+        self.note_repeater_enabled = False
+        self.repeater_pressure_multiplier = 1.0
+        self.repeater_frequency_multiplier = 1.0
+        self.strum_release_cfg: Dict[str, Any] = {}
+        # Mapping of control names to input values
+        self.control_inputs: Dict[str, float] = {
+            'yaxis': 0.0,
+            'pressure': 0.0,
+            'tiltX': 0.0,
+            'tiltY': 0.0,
+            'tiltXY': 0.0
+        }
+    
+    def refresh(self, cfg: Config) -> None:
+        """Re-read the cached config sections if the config changed since the last refresh."""
+        if self.revision == cfg.revision:
+            return
+        self.revision = cfg.revision
+        self.stylus_buttons_cfg = cfg.get('stylusButtons', {})
+        tablet_buttons_cfg = cfg.get('tabletButtons', {})
+        self.tablet_button_actions = tuple(
+            (i - 1, button_key, tablet_buttons_cfg.get(str(i)), f'Tablet{i}')
+            for i, button_key in enumerate(_BUTTON_KEYS, 1)
+        )
+        self.pitch_bend_fn = compile_effect(cfg.get('pitchBend', {}))
+        self.note_duration_fn = compile_effect(cfg.get('noteDuration', {}))
+        self.note_velocity_fn = compile_effect(cfg.get('noteVelocity', {}))
+        note_repeater_cfg = cfg.get('noteRepeater', {})
+        self.note_repeater_enabled = note_repeater_cfg.get('active', False)
+        self.repeater_pressure_multiplier = note_repeater_cfg.get('pressureMultiplier', 1.0)
+        self.repeater_frequency_multiplier = note_repeater_cfg.get('frequencyMultiplier', 1.0)
+        self.strum_release_cfg = cfg.get('strumRelease', {})
+
+
+async def _cancel_pending_tasks() -> None:
+    """Cancel every other task on the running event loop and wait for them to finish"""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current and not task.done()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
 
 def cleanup_resources():
     """Clean up device and MIDI resources"""
@@ -110,28 +187,13 @@ def cleanup_resources():
         try:
             if _event_loop.is_running():
                 print("Cancelling pending tasks...")
-                # Cancel all pending tasks in the event loop
-                def cancel_all_tasks():
-                    tasks = [task for task in asyncio.all_tasks(_event_loop) if not task.done()]
-                    for task in tasks:
-                        task.cancel()
-                    return len(tasks)
-                
-                # Schedule task cancellation in the event loop
-                future = asyncio.run_coroutine_threadsafe(
-                    asyncio.sleep(0),  # Dummy coroutine to get into the loop
-                    _event_loop
-                )
+                # Cancel and await the pending tasks from within the loop, so they
+                # have actually finished (not just been asked to) before it stops
+                future = asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), _event_loop)
                 try:
-                    future.result(timeout=0.5)
-                except:
-                    pass
-                
-                # Now cancel tasks from within the loop's thread
-                _event_loop.call_soon_threadsafe(cancel_all_tasks)
-                
-                # Give tasks a moment to cancel
-                time.sleep(0.2)
+                    future.result(timeout=3.0)
+                except Exception as e:
+                    print(f"Warning while cancelling tasks: {e}")
                 
                 print("Stopping event loop...")
                 _event_loop.call_soon_threadsafe(_event_loop.stop)
@@ -167,6 +229,16 @@ def cleanup_resources():
             _midi = None
 
 
+def _settings_path_in(directory: str) -> Optional[str]:
+    """Return the path of settings.json in directory if it exists (a single stat call), else None"""
+    path = os.path.join(directory, 'settings.json')
+    try:
+        os.stat(path)
+    except OSError:
+        return None
+    return path
+
+
 def find_settings_file() -> str:
     """
     Find settings.json file in various locations.
@@ -182,31 +254,21 @@ def find_settings_file() -> str:
         app_dir = os.path.dirname(sys.executable)
         # For macOS .app bundles, also check parent directories
         if sys.platform == 'darwin' and '.app/Contents/MacOS' in app_dir:
-            # Try the .app/Contents/Resources directory
-            bundle_dir = os.path.join(app_dir, '..', 'Resources')
-            if os.path.exists(os.path.join(bundle_dir, 'settings.json')):
-                return os.path.join(bundle_dir, 'settings.json')
-            # Try the directory containing the .app bundle
-            parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(app_dir)))
-            if os.path.exists(os.path.join(parent_dir, 'settings.json')):
-                return os.path.join(parent_dir, 'settings.json')
+            # Try the .app/Contents/Resources directory, then the directory containing the .app bundle
+            contents_dir = os.path.dirname(app_dir)
+            path = (_settings_path_in(os.path.join(contents_dir, 'Resources'))
+                    or _settings_path_in(os.path.dirname(os.path.dirname(contents_dir))))
+            if path:
+                return path
     else:
         # Running as script
         app_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # List of paths to check
-    search_paths = [
-        os.path.join(app_dir, 'settings.json'),
-        os.path.join(os.path.dirname(app_dir), 'settings.json'),
-        os.path.join(os.getcwd(), 'settings.json'),
-        os.path.join(os.path.expanduser('~'), 'settings.json'),
-    ]
-    
-    for path in search_paths:
-        if os.path.exists(path):
-            return path
-    
-    return None
+    # Stop at the first hit; later locations are only computed if needed
+    return (_settings_path_in(app_dir)
+            or _settings_path_in(os.path.dirname(app_dir))
+            or _settings_path_in(os.getcwd())
+            or _settings_path_in(os.path.expanduser('~')))
 
 
 def load_config(settings_file: Optional[str] = None) -> Config:
@@ -222,7 +284,7 @@ def load_config(settings_file: Optional[str] = None) -> Config:
             print(f"ERROR: Settings file not found: {settings_file}")
             sys.exit(1)
         print(f"Loading configuration from: {settings_file}")
-        return Config.from_file(settings_file)
+        return Config.from_file_cached(settings_file)
     
     # No explicit file provided, search default locations
     settings_path = find_settings_file()
@@ -238,7 +300,11 @@ def load_config(settings_file: Optional[str] = None) -> Config:
         return Config()
     
     print(f"Loading configuration from: {settings_path}")
-    return Config.from_file(settings_path)
+    return Config.from_file_cached(settings_path)
+
+
+# Serialized '{"type":<message_type>,' prefix per broadcast message type
+_MESSAGE_PREFIXES: Dict[str, str] = {}
 
 
 def broadcast_to_socket(socket_server: Optional[SocketServer], message_type: str, data: Dict[str, Any]) -> None:
@@ -252,10 +318,13 @@ def broadcast_to_socket(socket_server: Optional[SocketServer], message_type: str
     """
     if socket_server is not None:
         try:
-            message = json.dumps({
-                'type': message_type,
-                **data
-            })
+            # Splice the cached type prefix onto the serialized payload instead of
+            # merging the type into a fresh dict
+            prefix = _MESSAGE_PREFIXES.get(message_type)
+            if prefix is None:
+                prefix = _MESSAGE_PREFIXES[message_type] = '{"type":' + encode_message(message_type) + ','
+            payload = encode_message(data)
+            message = prefix + payload[1:] if data else prefix[:-1] + '}'
             socket_server.send_message_sync(message)
         except Exception as e:
             print(f"[SERVER] Error broadcasting to WebSocket: {e}")
@@ -271,7 +340,7 @@ def broadcast_strummer_notes(socket_server: Optional[SocketServer]) -> None:
     if socket_server is not None:
         try:
             notes_state = strummer.get_notes_state()
-            message = json.dumps(notes_state)
+            message = encode_message(notes_state)
             socket_server.send_message_sync(message)
         except Exception as e:
             print(f"[SERVER] Error broadcasting strummer notes: {e}")
@@ -280,7 +349,7 @@ def broadcast_strummer_notes(socket_server: Optional[SocketServer]) -> None:
 def on_midi_note_event(event: MidiNoteEvent, cfg: Config, socket_server: Optional[SocketServer] = None):
     """Handle MIDI note events - defined at module level to avoid garbage collection"""
     # Use notes from the event object instead of accessing midi.notes directly
-    midi_notes = [Note.parse_notation(n) for n in event.notes]
+    midi_notes = [_parse_notation(n) for n in event.notes]
     
     strumming_cfg = cfg.get('strumming', {})
     strummer.notes = Note.fill_note_spread(
@@ -303,7 +372,7 @@ def setup_midi_and_strummer(cfg: Config, socket_server: Optional[SocketServer] =
     # Initialize strummer with initial notes if provided
     strumming_cfg = cfg.get('strumming', {})
     if 'initialNotes' in strumming_cfg and strumming_cfg['initialNotes']:
-        initial_notes = [Note.parse_notation(n) for n in strumming_cfg['initialNotes']]
+        initial_notes = [_parse_notation(n) for n in strumming_cfg['initialNotes']]
         
         strummer.notes = Note.fill_note_spread(
             initial_notes, 
@@ -378,10 +447,11 @@ def update_config(cfg: Config, updates: Dict[str, Any], socket_server: Optional[
         if key in ['strumming.midiChannel', 'midiChannel']:
             midi_channel_changed = True
         
-        # Use Config.set() method which handles dot notation
-        cfg.set(key, value)
         print(f'[CONFIG] Updated {key} = {value}')
     
+    # Use Config.set_many() which handles dot notation and shared prefixes
+    cfg.set_many(updates.items())
+    
     # If note spreads changed and we have strummer notes, recalculate with new spreads
     if note_spread_changed and strummer.notes:
         # Get base notes from strummer
@@ -414,7 +484,7 @@ def update_config(cfg: Config, updates: Dict[str, Any], socket_server: Optional[
                 'type': 'config',
                 'config': cfg.to_dict()
             }
-            message = json.dumps(config_data)
+            message = encode_message(config_data)
             socket_server.send_message_sync(message)
         except Exception as e:
             print(f"[CONFIG] Error broadcasting config: {e}")
@@ -490,12 +560,11 @@ def create_hid_data_handler(cfg: Config, midi: Union[Midi, JackMidi], socket_ser
         """Broadcast config when actions change it"""
         if socket_server is not None:
             try:
-                import json
                 config_data = {
                     'type': 'config',
                     'config': cfg.to_dict()
                 }
-                message = json.dumps(config_data)
+                message = encode_message(config_data)
                 socket_server.send_message_sync(message)
             except Exception as e:
                 print(f"[ACTIONS] Error broadcasting config: {e}")
@@ -516,16 +585,47 @@ def create_hid_data_handler(cfg: Config, midi: Union[Midi, JackMidi], socket_ser
     }
     
     # Track tablet button states (buttons 1-8)
-    tablet_button_state = {f'button{i}': False for i in range(1, 9)}
+    tablet_button_state = dict.fromkeys(_BUTTON_KEYS, False)
+    
+    # Cached config sections and reusable per-report values
+    scratch = HidScratch()
+    control_inputs = scratch.control_inputs
+    
+    # String index of each strummer note, keyed by the fields NoteObject equality
+    # compares; the first matching string wins, as with a linear search
+    string_index: Dict[tuple, int] = {}
+    
+    def on_strummer_notes_changed():
+        """Rebuild the note -> string index map when the strummer notes are replaced"""
+        string_index.clear()
+        for idx, note in enumerate(strummer.notes):
+            string_index.setdefault((note.notation, note.octave, note.secondary), idx)
+    
+    strummer.on('notes_changed', on_strummer_notes_changed)
+    on_strummer_notes_changed()
     
     # Throttle state for WebSocket broadcasts (100ms = 10 times per second)
+    # Monotonic nanoseconds, so wall-clock (NTP) jumps can't stall or burst broadcasts
     throttle_state = {
-        'last_broadcast_time': 0,
-        'throttle_interval': 0.1  # 100ms in seconds
+        'last_broadcast_ns': 0,
+        'throttle_interval_ns': 100_000_000  # 100ms in nanoseconds
+    }
+    
+    # Tablet data payload, reused (updated in place) for every throttled broadcast
+    tablet_data = {
+        'x': 0.0,
+        'y': 0.0,
+        'pressure': 0.0,
+        'tiltX': 0.0,
+        'tiltY': 0.0,
+        'tiltXY': 0.0,
+        'primaryButtonPressed': False,
+        'secondaryButtonPressed': False
     }
     
     def handle_hid_data(result: Dict[str, Union[str, int, float]]) -> None:
         """Handle processed HID data - send MIDI messages based on strumming"""
+        scratch.refresh(cfg)
         
         # Extract raw data values
         x = result.get('x', 0.0)
@@ -539,7 +639,7 @@ def create_hid_data_handler(cfg: Config, midi: Union[Midi, JackMidi], socket_ser
         secondary_pressed = result.get('secondaryButtonPressed', False)
         
         # Get stylus button configuration
-        stylus_buttons_cfg = cfg.get('stylusButtons', {})
+        stylus_buttons_cfg = scratch.stylus_buttons_cfg
         
         # Detect button down events (transition from not pressed to pressed)
         if primary_pressed and not button_state['primaryButtonPressed']:
@@ -557,27 +657,26 @@ def create_hid_data_handler(cfg: Config, midi: Union[Midi, JackMidi], socket_ser
         button_state['secondaryButtonPressed'] = secondary_pressed
         
         # Handle tablet button presses (buttons 1-8)
-        tablet_buttons_cfg = cfg.get('tabletButtons', {})
-        for i in range(1, 9):
-            button_key = f'button{i}'
+        for button_index, button_key, action, button_label in scratch.tablet_button_actions:
             button_pressed = result.get(button_key, False)
+            was_pressed = tablet_button_state[button_key]
             
-            # Detect button down event (transition from not pressed to pressed)
-            if button_pressed and not tablet_button_state[button_key]:
-                # Button just pressed - execute configured action
-                action = tablet_buttons_cfg.get(str(i))
-                if action:
-                    actions.execute(action, context={'button': f'Tablet{i}'})
-                
-                # Broadcast button press to WebSocket
-                broadcast_to_socket(socket_server, 'tablet_button', {
-                    'button': i - 1,  # 0-indexed for frontend
-                    'pressed': True
-                })
-            elif not button_pressed and tablet_button_state[button_key]:
+            if button_pressed:
+                # Detect button down event (transition from not pressed to pressed)
+                if not was_pressed:
+                    # Button just pressed - execute configured action
+                    if action:
+                        actions.execute(action, context={'button': button_label})
+                    
+                    # Broadcast button press to WebSocket
+                    broadcast_to_socket(socket_server, 'tablet_button', {
+                        'button': button_index,
+                        'pressed': True
+                    })
+            elif was_pressed:
                 # Button released
                 broadcast_to_socket(socket_server, 'tablet_button', {
-                    'button': i - 1,  # 0-indexed for frontend
+                    'button': button_index,
                     'pressed': False
                 })
             
@@ -590,59 +689,55 @@ def create_hid_data_handler(cfg: Config, midi: Union[Midi, JackMidi], socket_ser
         tilt_x_val = float(tilt_x)
         tilt_y_val = float(tilt_y)
         # Calculate tiltXY magnitude with sign based on tiltX * tiltY
-        magnitude = math.sqrt(tilt_x_val * tilt_x_val + tilt_y_val * tilt_y_val)
-        sign = 1 if (tilt_x_val * tilt_y_val) >= 0 else -1
+        tilt_xy_val = sqrt(tilt_x_val * tilt_x_val + tilt_y_val * tilt_y_val)
+        if tilt_x_val * tilt_y_val < 0:
+            tilt_xy_val = -tilt_xy_val
         # Clamp to [-1, 1] range (magnitude can exceed 1 at corners)
-        tilt_xy_val = max(-1.0, min(1.0, magnitude * sign))
+        if tilt_xy_val > 1.0:
+            tilt_xy_val = 1.0
+        elif tilt_xy_val < -1.0:
+            tilt_xy_val = -1.0
         
         # Throttled broadcast of tablet data to WebSocket
-        current_time = time.time()
-        if socket_server and (current_time - throttle_state['last_broadcast_time']) >= throttle_state['throttle_interval']:
-            throttle_state['last_broadcast_time'] = current_time
-            broadcast_to_socket(socket_server, 'tablet_data', {
-                'x': float(x),
-                'y': float(y),
-                'pressure': float(pressure),
-                'tiltX': tilt_x_val,
-                'tiltY': tilt_y_val,
-                'tiltXY': tilt_xy_val,
-                'primaryButtonPressed': primary_pressed,
-                'secondaryButtonPressed': secondary_pressed
-            })
+        if socket_server:
+            now_ns = time.monotonic_ns()
+            if now_ns - throttle_state['last_broadcast_ns'] >= throttle_state['throttle_interval_ns']:
+                throttle_state['last_broadcast_ns'] = now_ns
+                tablet_data['x'] = float(x)
+                tablet_data['y'] = y_val
+                tablet_data['pressure'] = pressure_val
+                tablet_data['tiltX'] = tilt_x_val
+                tablet_data['tiltY'] = tilt_y_val
+                tablet_data['tiltXY'] = tilt_xy_val
+                tablet_data['primaryButtonPressed'] = primary_pressed
+                tablet_data['secondaryButtonPressed'] = secondary_pressed
+                broadcast_to_socket(socket_server, 'tablet_data', tablet_data)
         
-        # Create mapping of control names to input values
-        control_inputs = {
-            'yaxis': y_val,
-            'pressure': pressure_val,
-            'tiltX': tilt_x_val,
-            'tiltY': tilt_y_val,
-            'tiltXY': tilt_xy_val
-        }
+        # Update mapping of control names to input values
+        control_inputs['yaxis'] = y_val
+        control_inputs['pressure'] = pressure_val
+        control_inputs['tiltX'] = tilt_x_val
+        control_inputs['tiltY'] = tilt_y_val
+        control_inputs['tiltXY'] = tilt_xy_val
         
         # Debug: Log pressure values when strumming (disabled for cleaner logs)
         # if pressure_val > 0.05:  # Only log when there's meaningful pressure
         #     print(f"[HID] Pressure: {pressure_val:.4f}, X: {x:.4f}")
         
-        # Get effect configurations
-        pitch_bend_cfg = cfg.get('pitchBend', {})
-        note_duration_cfg = cfg.get('noteDuration', {})
-        note_velocity_cfg = cfg.get('noteVelocity', {})
-        
         # Apply pitch bend effect (TEMPORARILY DISABLED FOR DEBUGGING)
-        # bend_value = apply_effect(pitch_bend_cfg, control_inputs, 'pitchBend')
+        # bend_value = scratch.pitch_bend_fn(control_inputs)
         # midi.send_pitch_bend(bend_value)
         
         # Apply note duration and velocity effects
-        duration = apply_effect(note_duration_cfg, control_inputs, 'noteDuration')
-        velocity = apply_effect(note_velocity_cfg, control_inputs, 'noteVelocity')
+        duration = scratch.note_duration_fn(control_inputs)
+        velocity = scratch.note_velocity_fn(control_inputs)
         
         strum_result = strummer.strum(float(x), float(pressure))
         
         # Get note repeater configuration
-        note_repeater_cfg = cfg.get('noteRepeater', {})
-        note_repeater_enabled = note_repeater_cfg.get('active', False)
-        pressure_multiplier = note_repeater_cfg.get('pressureMultiplier', 1.0)
-        frequency_multiplier = note_repeater_cfg.get('frequencyMultiplier', 1.0)
+        note_repeater_enabled = scratch.note_repeater_enabled
+        pressure_multiplier = scratch.repeater_pressure_multiplier
+        frequency_multiplier = scratch.repeater_frequency_multiplier
         
         # Get transpose state from actions
         transpose_enabled = actions.is_transpose_active()
@@ -656,25 +751,31 @@ def create_hid_data_handler(cfg: Config, midi: Union[Midi, JackMidi], socket_ser
                 repeater_state['is_holding'] = True
                 repeater_state['last_repeat_time'] = time.time()
                 
-                # Play notes from strum
-                for note_data in strum_result['notes']:
-                    # Skip notes with velocity 0 (these would act as note-off in MIDI)
-                    if note_data['velocity'] > 0:
-                        # Apply transpose if enabled
-                        note_to_play = note_data['note']
-                        if transpose_enabled:
-                            note_to_play = note_to_play.transpose(transpose_semitones)
-                        midi.send_note(note_to_play, note_data['velocity'], duration)
-                        
+                # Skip notes with velocity 0 (these would act as note-off in MIDI)
+                plucked_notes = [note_data for note_data in strum_result['notes'] if note_data['velocity'] > 0]
+                
+                # Play notes from strum in one batch, applying transpose if enabled
+                if transpose_enabled:
+                    midi.send_notes_batch([
+                        (note_data['note'].transpose(transpose_semitones), note_data['velocity'])
+                        for note_data in plucked_notes
+                    ], duration)
+                else:
+                    midi.send_notes_batch([
+                        (note_data['note'], note_data['velocity']) for note_data in plucked_notes
+                    ], duration)
+                
+                if socket_server:
+                    for note_data in plucked_notes:
                         # Broadcast string pluck to WebSocket
                         # Find which string index was plucked by matching the note
-                        for string_idx, strummer_note in enumerate(strummer.notes):
-                            if strummer_note == note_data['note']:
-                                broadcast_to_socket(socket_server, 'string_pluck', {
-                                    'string': string_idx,
-                                    'velocity': note_data['velocity']
-                                })
-                                break
+                        plucked = note_data['note']
+                        string_idx = string_index.get((plucked.notation, plucked.octave, plucked.secondary))
+                        if string_idx is not None:
+                            broadcast_to_socket(socket_server, 'string_pluck', {
+                                'string': string_idx,
+                                'velocity': note_data['velocity']
+                            })
             
             elif strum_result.get('type') == 'release':
                 # Stop holding - no more repeats
@@ -682,7 +783,7 @@ def create_hid_data_handler(cfg: Config, midi: Union[Midi, JackMidi], socket_ser
                 repeater_state['notes'] = []
                 
                 # Handle strum release - send configured MIDI note
-                strum_release_cfg = cfg.get('strumRelease', {})
+                strum_release_cfg = scratch.strum_release_cfg
                 release_note = strum_release_cfg.get('midiNote')
                 release_channel = strum_release_cfg.get('midiChannel')
                 release_max_duration = strum_release_cfg.get('maxDuration', 0.25)
@@ -713,16 +814,22 @@ def create_hid_data_handler(cfg: Config, midi: Union[Midi, JackMidi], socket_ser
                 # Clamp to MIDI range 1-127
                 repeat_velocity = max(1, min(127, repeat_velocity))
                 
-                for note_data in repeater_state['notes']:
-                    if repeat_velocity > 0:
-                        # Apply transpose if enabled
-                        note_to_play = note_data['note']
-                        if transpose_enabled:
-                            note_to_play = note_to_play.transpose(transpose_semitones)
-                        midi.send_note(note_to_play, repeat_velocity, duration)
+                # Apply transpose if enabled and replay all held notes in one batch
+                if transpose_enabled:
+                    midi.send_notes_batch([
+                        (note_data['note'].transpose(transpose_semitones), repeat_velocity)
+                        for note_data in repeater_state['notes']
+                    ], duration)
+                else:
+                    midi.send_notes_batch([
+                        (note_data['note'], repeat_velocity) for note_data in repeater_state['notes']
+                    ], duration)
                 
                 repeater_state['last_repeat_time'] = current_time
     
+    # Store handler reference to prevent garbage collection (emitters hold weak references)
+    handle_hid_data._notes_changed_handler = on_strummer_notes_changed
+    
     return handle_hid_data
 
 
@@ -796,6 +903,9 @@ Examples:
     )
     args = parser.parse_args()
     
+    # Modules that log (e.g. the HID reader) print plain messages to stdout like everything else
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     # Register cleanup function to run on exit
     atexit.register(cleanup_resources)
     
@@ -917,24 +1027,10 @@ Examples:
             _hid_readers = []
         
         # Update config with new device configuration
-        startup_cfg = cfg.get('startupConfiguration', {})
-        
         # Merge device info and byte mappings into drawing tablet config
-        tablet_config = {}
-        if 'deviceInfo' in driver_config:
-            tablet_config.update(driver_config['deviceInfo'])
-        if 'byteCodeMappings' in driver_config:
-            tablet_config['byteCodeMappings'] = driver_config['byteCodeMappings']
-        if 'reportId' in driver_config:
-            tablet_config['reportId'] = driver_config['reportId']
-        tablet_config['_driverName'] = driver_name
-        tablet_config['_driverInfo'] = {
-            'name': driver_config.get('name'),
-            'manufacturer': driver_config.get('manufacturer'),
-            'model': driver_config.get('model')
-        }
+        tablet_config = Config.build_tablet_config(driver_name, driver_config)
         
-        startup_cfg['drawingTablet'] = tablet_config
+        cfg.set('startupConfiguration.drawingTablet', tablet_config)
         
         # Find and open all interfaces for this device
         devices = find_and_open_all_interfaces(tablet_config)
@@ -974,7 +1070,7 @@ Examples:
                                         'type': 'config',
                                         'config': cfg.to_dict()
                                     }
-                                    message = json.dumps(config_data)
+                                    message = encode_message(config_data)
                                     _socket_server.send_message_sync(message)
                                 except Exception as e:
                                     print(f"[ACTIONS] Error broadcasting config: {e}")
@@ -1044,9 +1140,7 @@ Examples:
         # Start hotplug monitor to detect when device is connected
         try:
             # Get available driver profiles for monitoring
-            from config import Config
-            temp_cfg = Config()
-            driver_profiles = temp_cfg._get_available_drivers()
+            driver_profiles = cfg._get_available_drivers()
             
             if driver_profiles:
                 _hotplug_monitor = HotplugMonitor(
@@ -1085,9 +1179,7 @@ Examples:
         
         # Start hotplug monitor to detect disconnection and reconnection
         try:
-            from config import Config
-            temp_cfg = Config()
-            driver_profiles = temp_cfg._get_available_drivers()
+            driver_profiles = cfg._get_available_drivers()
             
             if driver_profiles:
                 _hotplug_monitor = HotplugMonitor(
@@ -1127,7 +1219,7 @@ Examples:
                                         'type': 'config',
                                         'config': cfg.to_dict()
                                     }
-                                    message = json.dumps(config_data)
+                                    message = encode_message(config_data)
                                     _socket_server.send_message_sync(message)
                                 except Exception as e:
                                     print(f"[ACTIONS] Error broadcasting config: {e}")
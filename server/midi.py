@@ -1,6 +1,6 @@
 import time
 import threading
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 import rtmidi
 from note import Note, NoteObject
 from midievent import MidiConnectionEvent, MidiNoteEvent, NOTE_EVENT, CONNECTION_EVENT
@@ -280,6 +280,20 @@ class Midi(EventEmitter):
                 self._active_note_timers[note_key] = timer
             timer.start()
     
+    def send_notes_batch(self, notes: Sequence[Tuple[NoteObject, int]], duration: float = 1.5) -> None:
+        """
+        Send several MIDI notes at once with non-blocking note-offs.
+        
+        rtmidi sends each message individually, so this is equivalent to calling
+        send_note() for every pair.
+        
+        Args:
+            notes: (note, velocity) pairs to play
+            duration: Duration in seconds before note-off
+        """
+        for note, velocity in notes:
+            self.send_note(note, velocity, duration)
+    
     def send_raw_note(self, midi_note: int, velocity: int, channel: Optional[int] = None, duration: float = 1.5) -> None:
         """
         Send a raw MIDI note number on a specific channel with non-blocking note-off
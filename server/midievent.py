@@ -2,7 +2,7 @@
 Pythonic MIDI event definitions using dataclasses.
 """
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional, Sequence
 
 
 @dataclass
@@ -16,7 +16,7 @@ class MidiConnectionEvent:
 @dataclass  
 class MidiNoteEvent:
     """Event fired when MIDI notes change."""
-    notes: List[str]  # List of active note strings like ['C4', 'E4', 'G4']
+    notes: Sequence[str]  # Active note strings like ['C4', 'E4', 'G4'] (treat as read-only)
     added: Optional[str] = None  # Note that was just added (if any)
     removed: Optional[str] = None  # Note that was just removed (if any)
 
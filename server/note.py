@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import math
 import json
@@ -151,19 +151,21 @@ class Note:
                 nt_indx = 0
         return nt_obj.octave * len(cls.sharp_notations) + nt_indx
 
+    @classmethod
+    def sort_key(cls, note: str) -> Tuple[int, int]:
+        """Sort key for a note string: (octave, notation index)"""
+        octave = int(note[-1]) if note[-1].isdigit() else 4
+        notation = note[:-1] if note[-1].isdigit() else note
+        try:
+            notation_index = cls.sharp_notations.index(notation)
+        except ValueError:
+            notation_index = 0
+        return (octave, notation_index)
+
     @classmethod
     def sort(cls, notes: List[str]) -> List[str]:
         """Sort notes by octave and then by notation"""
-        def sort_key(note: str):
-            octave = int(note[-1]) if note[-1].isdigit() else 4
-            notation = note[:-1] if note[-1].isdigit() else note
-            try:
-                notation_index = cls.sharp_notations.index(notation)
-            except ValueError:
-                notation_index = 0
-            return (octave, notation_index)
-        
-        return sorted(notes, key=sort_key)
+        return sorted(notes, key=cls.sort_key)
 
     @classmethod
     def parse_notation(cls, notation: str) -> NoteObject:
@@ -350,26 +352,30 @@ class Note:
         if not notes:
             return []
         
+        # Spread notes cycle through the base notes, one octave further out per full
+        # pass: upward in order, downward starting from the highest base note
+        count = len(notes)
+        
         upper = []
-        for c in range(upper_spread):
-            note_index = c % len(notes)
-            octave_increase = c // len(notes)
-            upper.append(NoteObject(
-                notation=notes[note_index].notation,
-                octave=notes[note_index].octave + octave_increase + 1,
-                secondary=True
-            ))
+        if upper_spread > 0:
+            passes, remainder = divmod(upper_spread, count)
+            upper = [
+                NoteObject(note.notation, note.octave + octave_offset, True)
+                for octave_offset in range(1, passes + 1)
+                for note in notes
+            ]
+            upper += [NoteObject(note.notation, note.octave + passes + 1, True) for note in notes[:remainder]]
         
         lower = []
-        for c in range(lower_spread):
-            note_index = c % len(notes)
-            octave_decrease = c // len(notes)
-            reverse_index = len(notes) - 1 - note_index
-            lower.append(NoteObject(
-                notation=notes[reverse_index].notation,
-                octave=notes[reverse_index].octave - octave_decrease - 1,
-                secondary=True
-            ))
+        if lower_spread > 0:
+            passes, remainder = divmod(lower_spread, count)
+            reversed_notes = notes[::-1]
+            lower = [
+                NoteObject(note.notation, note.octave - octave_offset, True)
+                for octave_offset in range(1, passes + 1)
+                for note in reversed_notes
+            ]
+            lower += [NoteObject(note.notation, note.octave - passes - 1, True) for note in reversed_notes[:remainder]]
         
         return [*lower, *notes, *upper]
 
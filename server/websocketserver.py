@@ -2,6 +2,17 @@ import asyncio
 import websockets
 from typing import Set, Callable, Optional, Dict, Any
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_message(data: Any) -> str:
+    """Serialize a message to JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data)
 
 
 class SocketServer:
@@ -13,11 +24,17 @@ class SocketServer:
         self.config_callback = config_callback
         self.initial_notes_callback = initial_notes_callback
         self.device_status_callback = device_status_callback
+        # Broadcasts from other threads are queued onto the server's loop and sent
+        # in order by a single drain task (oldest dropped if clients fall behind)
+        self._broadcast_queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
 
     async def start(self, port: int = 8080, host: str = '0.0.0.0'):
         """Start the WebSocket server"""
         # Store the event loop for cross-thread access
         self.loop = asyncio.get_event_loop()
+        self._broadcast_queue = asyncio.Queue(maxsize=64)
+        self._drain_task = self.loop.create_task(self._drain_broadcasts())
         print(f'WebSocket server is running on ws://{host}:{port}')
         
         async def handle_client(websocket):
@@ -28,7 +45,7 @@ class SocketServer:
             if self.config_callback is not None:
                 try:
                     config_data = self.config_callback()
-                    config_message = json.dumps({
+                    config_message = encode_message({
                         'type': 'config',
                         'config': config_data
                     })
@@ -40,7 +57,7 @@ class SocketServer:
             if self.initial_notes_callback is not None:
                 try:
                     notes_data = self.initial_notes_callback()
-                    notes_message = json.dumps(notes_data)
+                    notes_message = encode_message(notes_data)
                     await websocket.send(notes_message)
                 except Exception as e:
                     print(f'Error sending initial notes to new client: {e}')
@@ -49,7 +66,7 @@ class SocketServer:
             if self.device_status_callback is not None:
                 try:
                     device_status = self.device_status_callback()
-                    device_message = json.dumps(device_status)
+                    device_message = encode_message(device_status)
                     await websocket.send(device_message)
                     print(f'[WebSocket] Sent initial device status to client: connected={device_status.get("connected")}')
                 except Exception as e:
@@ -98,6 +115,11 @@ class SocketServer:
         """Async stop method - properly closes server and connections"""
         print('Server stopping...')
         
+        # Stop sending queued broadcasts
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        
         # Close all active websocket connections
         if self.sockets:
             sockets_copy = self.sockets.copy()
@@ -138,9 +160,23 @@ class SocketServer:
                     print(f"Error sending message: {e}")
                     self.sockets.discard(socket)
 
+    async def _drain_broadcasts(self):
+        """Send queued broadcast messages to all clients, one at a time"""
+        queue = self._broadcast_queue
+        while True:
+            message = await queue.get()
+            await self.send_message(message)
+
+    def _enqueue_broadcast(self, message: str):
+        """Queue a broadcast message (runs on the server's loop), dropping the oldest if full"""
+        queue = self._broadcast_queue
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
+
     def send_message_sync(self, message: str):
         """Synchronous wrapper for send_message - thread-safe"""
-        if self.sockets and self.loop:
-            # Schedule the coroutine in the server's event loop (thread-safe)
-            asyncio.run_coroutine_threadsafe(self.send_message(message), self.loop)
+        if self.sockets and self.loop and self._broadcast_queue is not None:
+            # Hand the message to the server's event loop (thread-safe)
+            self.loop.call_soon_threadsafe(self._enqueue_broadcast, message)
 